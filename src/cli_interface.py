@@ -341,7 +341,9 @@ class CLI:
 
         if use_vis:
             print("  👁️  Analyzing images...")
-            vis = VisionExtractor()
+            vis = VisionExtractor(
+                cache_file=os.path.join("data", "vision_cache.jsonl")
+            )
             for p in args.paths:
                 if os.path.isdir(p):
                     images = vis.find_images(p, recursive=rec)
@@ -9,10 +9,24 @@ Supports:
 
 import os
 import yaml
-import copy
 from typing import Any, Dict, Optional
 from pathlib import Path
 
+# libyaml's C loader/dumper is several times faster than pure-Python PyYAML
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+
+def _copy_config(node: Any) -> Any:
+    """Copy a config tree of dicts, lists and scalars"""
+    if isinstance(node, dict):
+        return {key: _copy_config(value) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_copy_config(value) for value in node]
+    return node
+
 
 class ConfigManager:
     """Configuration manager with YAML file, env vars, and CLI overrides"""
@@ -87,7 +101,7 @@ class ConfigManager:
         self.config_path = config_path or os.path.join(
             os.path.expanduser("~"), ".config", "gdo", "config.yaml"
         )
-        self.config = copy.deepcopy(self.DEFAULT_CONFIG)
+        self.config = _copy_config(self.DEFAULT_CONFIG)
         self._load_config()
         self._apply_env_overrides()
 
@@ -97,7 +111,7 @@ class ConfigManager:
             config_file = Path(self.config_path)
             if config_file.exists():
                 with open(config_file, "r") as f:
-                    user_config = yaml.safe_load(f) or {}
+                    user_config = yaml.load(f, Loader=SafeLoader) or {}
                 self._deep_merge(self.config, user_config)
                 print(f"✓ Loaded config from {self.config_path}")
             else:
@@ -221,14 +235,20 @@ class ConfigManager:
         try:
             os.makedirs(os.path.dirname(save_path), exist_ok=True)
             with open(save_path, "w") as f:
-                yaml.dump(self.config, f, default_flow_style=False, indent=2)
+                yaml.dump(
+                    self.config,
+                    f,
+                    Dumper=SafeDumper,
+                    default_flow_style=False,
+                    indent=2,
+                )
             print(f"✓ Config saved to {save_path}")
         except Exception as e:
             print(f"⚠️  Error saving config: {e}")
 
     def reset(self) -> None:
         """Reset to default configuration"""
-        self.config = copy.deepcopy(self.DEFAULT_CONFIG)
+        self.config = _copy_config(self.DEFAULT_CONFIG)
         self._apply_env_overrides()
 
     def reset_to_defaults(self) -> None:
@@ -270,7 +290,13 @@ class ConfigManager:
         )
         try:
             with open(sample_path, "w") as f:
-                yaml.dump(self.DEFAULT_CONFIG, f, default_flow_style=False, indent=2)
+                yaml.dump(
+                    self.DEFAULT_CONFIG,
+                    f,
+                    Dumper=SafeDumper,
+                    default_flow_style=False,
+                    indent=2,
+                )
             return sample_path
         except Exception as e:
             return f"Error: {e}"
@@ -5,10 +5,33 @@ Content Indexer
 import os
 import re
 import json
-from typing import Dict, List, Optional, Set
-from collections import Counter
+import sqlite3
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from collections import Counter, OrderedDict
 from datetime import datetime
 
+# Keyword candidates: whole words of four or more ASCII letters
+_WORD_RE = re.compile(r"\b[a-zA-Z]{4,}\b")
+
+# Common words filtered out of keywords
+_COMMON_WORDS = frozenset(
+    {
+        "this",
+        "that",
+        "with",
+        "from",
+        "have",
+        "were",
+        "been",
+        "their",
+        "there",
+        "which",
+        "would",
+        "could",
+        "should",
+    }
+)
+
 
 class ContentIndexer:
     """
@@ -26,10 +49,29 @@ class ContentIndexer:
     - Performance tracking
     """
 
-    def __init__(self):
-        """Initialize content indexer"""
+    def __init__(self, cache_size: int = 256):
+        """
+        Initialize content indexer
+
+        Args:
+            cache_size: Maximum number of cached search/find_similar results
+                (least recently used entries are evicted first)
+        """
+        # File metadata lives in self.index; contents and the inverted index
+        # live in an in-memory FTS5 table keyed by a per-file rowid
         self.index = {}
-        self.keywords = {}
+        self._rowids = {}
+        self._next_rowid = 1
+        # st_mtime_ns per indexed path, so update_index skips unchanged files
+        self._mtimes = {}
+        # Query results, dropped whenever the indexed set of files changes
+        self.cache_size = cache_size
+        self._query_cache: "OrderedDict[Tuple, List[Dict]]" = OrderedDict()
+        self.db = sqlite3.connect(":memory:")
+        self.db.execute(
+            "CREATE VIRTUAL TABLE docs USING "
+            "fts5(path UNINDEXED, content, tokenize='porter unicode61')"
+        )
         self.stats = {"total_files": 0, "total_keywords": 0, "indexed_at": None}
 
     def index_directory(self, directory: str) -> List[Dict]:
@@ -47,12 +89,56 @@ class ContentIndexer:
 
         indexed = []
 
-        for item in os.listdir(directory):
-            file_path = os.path.join(directory, item)
+        # One transaction for the whole directory; rows are streamed from
+        # the generator so contents are never all held at once
+        with self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO docs(rowid, path, content) VALUES (?, ?, ?)",
+                self._index_rows(directory, indexed),
+            )
+
+        self.stats["indexed_at"] = datetime.now().isoformat()
+
+        return indexed
+
+    def _index_rows(
+        self,
+        directory: str,
+        indexed: List[Dict],
+        seen: Optional[Set[str]] = None,
+    ) -> Iterator[Tuple[int, str, str]]:
+        """
+        Register each text file in a directory and yield its FTS row
+
+        Args:
+            directory: Directory to index
+            indexed: List collecting the indexed file dicts
+            seen: If given, collects every file path found and files whose
+                mtime is unchanged since they were indexed are skipped
+
+        Returns:
+            Iterator of (rowid, path, content) rows
+        """
+        with os.scandir(directory) as it:
+            entries = list(it)
+
+        for entry in entries:
+            file_path = os.path.join(directory, entry.name)
 
-            if not os.path.isfile(file_path):
+            try:
+                if not entry.is_file():
+                    continue
+                mtime = entry.stat().st_mtime_ns
+            except OSError:
                 continue
 
+            # Unchanged files are skipped before anything else looks at them;
+            # only indexed text files have an mtime recorded
+            if seen is not None:
+                seen.add(file_path)
+                if self._mtimes.get(file_path) == mtime:
+                    continue
+
             # Skip binary files
             if self._is_binary_file(file_path):
                 continue
@@ -63,31 +149,45 @@ class ContentIndexer:
             if content is None:
                 continue
 
-            # Extract keywords
-            keywords = self.extract_keywords(content)
-
-            # Add to index
-            self.index[file_path] = {
-                "file": item,
-                "path": file_path,
-                "content": content,
-                "keywords": keywords,
-                "indexed_at": datetime.now().isoformat(),
-            }
-
-            # Update keyword index
-            for keyword in keywords:
-                if keyword not in self.keywords:
-                    self.keywords[keyword] = []
-                self.keywords[keyword].append(file_path)
-
-            indexed.append(self.index[file_path])
+            self._mtimes[file_path] = mtime
+            rowid = self._add_document(file_path, entry.name, content)
+            yield rowid, file_path, content
+            indexed.append({**self.index[file_path], "content": content})
+
+    def _add_document(self, file_path: str, item: str, content: str) -> int:
+        """
+        Record metadata for a file and return its FTS rowid
+
+        Args:
+            file_path: Path to file
+            item: File name
+            content: Text content
+
+        Returns:
+            Rowid to store the content under (reused on re-index)
+        """
+        # Extract keywords
+        keywords = self.extract_keywords(content)
+
+        self._query_cache.clear()
+        previous = self.index.get(file_path)
+        if previous is not None:
+            self.stats["total_keywords"] -= len(previous["keywords"])
+        else:
+            self._rowids[file_path] = self._next_rowid
+            self._next_rowid += 1
             self.stats["total_files"] += 1
-            self.stats["total_keywords"] += len(keywords)
 
-        self.stats["indexed_at"] = datetime.now().isoformat()
+        # Add to index
+        self.index[file_path] = {
+            "file": item,
+            "path": file_path,
+            "keywords": keywords,
+            "indexed_at": datetime.now().isoformat(),
+        }
+        self.stats["total_keywords"] += len(keywords)
 
-        return indexed
+        return self._rowids[file_path]
 
     def search(self, query: str, limit: int = 10) -> List[Dict]:
         """
@@ -100,49 +200,107 @@ class ContentIndexer:
         Returns:
             List of matching file dicts
         """
-        query_lower = query.lower()
-        results = []
+        key = ("search", query, limit)
+        results = self._cache_get(key)
+        if results is not None:
+            return results
+
+        # Quote each term so punctuation in the query is never FTS syntax
+        terms = ['"' + term.replace('"', '""') + '"' for term in query.split()]
+        if not terms:
+            return []
 
-        for file_path, file_data in self.index.items():
-            # Search in content
-            if query_lower in file_data["content"].lower():
-                results.append(file_data)
-                continue
+        rows = self.db.execute(
+            "SELECT path, content FROM docs WHERE docs MATCH ? ORDER BY rank LIMIT ?",
+            (" ".join(terms), limit),
+        )
+        results = [{**self.index[path], "content": content} for path, content in rows]
 
-            # Search in keywords
-            for keyword in file_data["keywords"]:
-                if query_lower in keyword.lower():
-                    results.append(file_data)
-                    break
+        return self._cache_put(key, results)
 
-        return results[:limit]
+    def _cache_get(self, key: Tuple) -> Optional[List[Dict]]:
+        """
+        Look up cached query results
+
+        Args:
+            key: Query cache key
+
+        Returns:
+            Copy of the cached results or None on a miss
+        """
+        results = self._query_cache.get(key)
+        if results is None:
+            return None
+        self._query_cache.move_to_end(key)
+        return self._copy_results(results)
+
+    def _cache_put(self, key: Tuple, results: List[Dict]) -> List[Dict]:
+        """
+        Cache query results
+
+        Args:
+            key: Query cache key
+            results: Freshly computed results
+
+        Returns:
+            Copy of the results for the caller
+        """
+        self._query_cache[key] = results
+        if len(self._query_cache) > self.cache_size:
+            self._query_cache.popitem(last=False)
+        return self._copy_results(results)
+
+    @staticmethod
+    def _copy_results(results: List[Dict]) -> List[Dict]:
+        """Copy result dicts and their lists so callers cannot mutate the cache"""
+        return [
+            {k: list(v) if isinstance(v, list) else v for k, v in result.items()}
+            for result in results
+        ]
 
     def update_index(self, directory: str) -> List[Dict]:
         """
         Update index with new/modified files
 
+        Files are compared by st_mtime_ns against the last index; unchanged
+        files are not re-read and files that disappeared are dropped.
+
         Args:
             directory: Directory to update
 
         Returns:
-            List of newly indexed files
+            List of new or modified files that were (re)indexed
         """
-        new_files = []
-
-        for item in os.listdir(directory):
-            file_path = os.path.join(directory, item)
-
-            if not os.path.isfile(file_path):
-                continue
+        if not os.path.isdir(directory):
+            return []
 
-            # Skip if already indexed
-            if file_path in self.index:
-                continue
+        new_files = []
+        seen = set()
+
+        # Inserts and deletes share one transaction, so the whole update
+        # commits once. Only new files and files whose mtime moved are read
+        # and tokenized.
+        with self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO docs(rowid, path, content) VALUES (?, ?, ?)",
+                self._index_rows(directory, new_files, seen),
+            )
+
+            # Drop files indexed from this directory that no longer exist
+            prefix = os.path.join(directory, "")
+            vanished = [
+                file_path
+                for file_path in self.index
+                if file_path.startswith(prefix)
+                and file_path not in seen
+                and os.sep not in file_path[len(prefix) :]
+            ]
+            self.db.executemany(
+                "DELETE FROM docs WHERE rowid = ?",
+                [(self._drop_document(file_path),) for file_path in vanished],
+            )
 
-            # Index new file
-            indexed = self.index_directory(directory)
-            if file_path in [i["path"] for i in indexed]:
-                new_files.extend([i for i in indexed if i["path"] == file_path])
+        self.stats["indexed_at"] = datetime.now().isoformat()
 
         return new_files
 
@@ -156,27 +314,9 @@ class ContentIndexer:
         Returns:
             List of keywords
         """
-        # Simple keyword extraction
-        words = re.findall(r"\b[a-zA-Z]{4,}\b", content)
-
-        # Filter common words
-        common_words = {
-            "this",
-            "that",
-            "with",
-            "from",
-            "have",
-            "were",
-            "been",
-            "their",
-            "there",
-            "which",
-            "would",
-            "could",
-            "should",
-        }
-
-        keywords = [word.lower() for word in words if word.lower() not in common_words]
+        # Lowercase each match once; the compiled pattern does the scanning
+        words = [word.lower() for word in _WORD_RE.findall(content)]
+        keywords = [word for word in words if word not in _COMMON_WORDS]
 
         # Count frequency and return top keywords
         keyword_counts = Counter(keywords)
@@ -195,9 +335,16 @@ class ContentIndexer:
         Args:
             export_path: Path to export file
         """
+        index = {path: dict(file_data) for path, file_data in self.index.items()}
+        keywords = {}
+        for path, content in self.db.execute("SELECT path, content FROM docs"):
+            index[path]["content"] = content
+            for keyword in index[path]["keywords"]:
+                keywords.setdefault(keyword, []).append(path)
+
         data = {
-            "index": self.index,
-            "keywords": self.keywords,
+            "index": index,
+            "keywords": keywords,
             "stats": self.stats,
             "exported_at": datetime.now().isoformat(),
         }
@@ -217,8 +364,22 @@ class ContentIndexer:
         with open(import_path, "r") as f:
             data = json.load(f)
 
-        self.index = data.get("index", {})
-        self.keywords = data.get("keywords", {})
+        self.clear_index()
+
+        rows = []
+        for file_path, file_data in data.get("index", {}).items():
+            file_data = dict(file_data)
+            content = file_data.pop("content", "")
+            self.index[file_path] = file_data
+            self._rowids[file_path] = self._next_rowid
+            rows.append((self._next_rowid, file_path, content))
+            self._next_rowid += 1
+
+        with self.db:
+            self.db.executemany(
+                "INSERT INTO docs(rowid, path, content) VALUES (?, ?, ?)", rows
+            )
+
         self.stats = data.get("stats", {"total_files": 0, "total_keywords": 0})
 
     def remove_from_index(self, file_path: str):
@@ -231,22 +392,37 @@ class ContentIndexer:
         if file_path not in self.index:
             return
 
-        # Remove from index
-        keywords = self.index[file_path].get("keywords", [])
+        # Remove from full-text index
+        with self.db:
+            self.db.execute(
+                "DELETE FROM docs WHERE rowid = ?", (self._drop_document(file_path),)
+            )
+
+    def _drop_document(self, file_path: str) -> int:
+        """
+        Forget an indexed file's metadata and return its FTS rowid
 
-        # Remove from keyword index
-        for keyword in keywords:
-            if keyword in self.keywords and file_path in self.keywords[keyword]:
-                self.keywords[keyword].remove(file_path)
+        Args:
+            file_path: Path to an indexed file
 
-        # Remove from index
+        Returns:
+            Rowid of the file's row, for the caller to delete
+        """
+        self._query_cache.clear()
+        self.stats["total_keywords"] -= len(self.index[file_path]["keywords"])
         del self.index[file_path]
+        self._mtimes.pop(file_path, None)
         self.stats["total_files"] -= 1
+        return self._rowids.pop(file_path)
 
     def clear_index(self):
         """Clear entire index"""
         self.index = {}
-        self.keywords = {}
+        self._rowids = {}
+        self._mtimes = {}
+        self._query_cache.clear()
+        with self.db:
+            self.db.execute("DELETE FROM docs")
         self.stats = {"total_files": 0, "total_keywords": 0, "indexed_at": None}
 
     def find_similar(self, file_path: str, limit: int = 5) -> List[Dict]:
@@ -263,6 +439,11 @@ class ContentIndexer:
         if file_path not in self.index:
             return []
 
+        key = ("similar", file_path, limit)
+        results = self._cache_get(key)
+        if results is not None:
+            return results
+
         # Get keywords for file
         keywords = set(self.index[file_path].get("keywords", []))
 
@@ -294,7 +475,7 @@ class ContentIndexer:
         # Sort by similarity and limit
         similar_files.sort(key=lambda x: x["similarity"], reverse=True)
 
-        return similar_files[:limit]
+        return self._cache_put(key, similar_files[:limit])
 
     def _is_binary_file(self, file_path: str) -> bool:
         """
@@ -6,7 +6,9 @@ import os
 import json
 import time
 import threading
-from typing import Dict, List, Optional, Callable
+from collections import deque
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Callable, Tuple
 from datetime import datetime
 import shutil
 
@@ -37,7 +39,8 @@ class DiskMonitor:
         """
         self.threshold = threshold
         self.max_history = max_history
-        self.usage_history = []
+        # Bounded: appending past max_history drops the oldest measurement
+        self.usage_history = deque(maxlen=max_history)
         self.monitoring = False
         self.monitor_thread = None
         self.alert_callback = None
@@ -87,21 +90,47 @@ class DiskMonitor:
         Returns:
             Size in bytes
         """
-        total_size = 0
-
         try:
-            for dirpath, dirnames, filenames in os.walk(directory):
-                for filename in filenames:
-                    file_path = os.path.join(dirpath, filename)
+            return sum(size for _, size in self._walk_sizes(directory))
+        except Exception as e:
+            print(f"⚠️  Error calculating directory size: {e}")
+            return 0
+
+    def _walk_sizes(self, root: str) -> Iterator[Tuple[str, int]]:
+        """
+        Yield the total size of the files directly inside each directory
+
+        Walks with scandir off an explicit stack, so file/dir checks come from
+        the readdir type bits and each file costs a single stat. Like os.walk,
+        symlinked directories are not descended and unreadable ones skipped.
+
+        Args:
+            root: Directory to walk
+
+        Returns:
+            Iterator of (directory path, size in bytes)
+        """
+        stack = [root]
+        while stack:
+            dirpath = stack.pop()
+            total_size = 0
+            try:
+                it = os.scandir(dirpath)
+            except OSError:
+                continue
+
+            with it:
+                for entry in it:
                     try:
-                        total_size += os.path.getsize(file_path)
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                stack.append(entry.path)
+                            continue
+                        total_size += entry.stat().st_size
                     except OSError:
                         continue
 
-            return total_size
-        except Exception as e:
-            print(f"⚠️  Error calculating directory size: {e}")
-            return 0
+            yield dirpath, total_size
 
     def start_monitoring(self, path: str = "/", interval: int = 60):
         """
@@ -146,10 +175,6 @@ class DiskMonitor:
         usage = self.get_disk_usage(path)
         self.usage_history.append(usage)
 
-        # Trim history to max_history
-        if len(self.usage_history) > self.max_history:
-            self.usage_history = self.usage_history[-self.max_history :]
-
         # Check threshold
         self.check_threshold(usage)
 
@@ -188,7 +213,7 @@ class DiskMonitor:
 
     def get_usage_history(self) -> List[Dict]:
         """Get all recorded usage measurements"""
-        return self.usage_history
+        return list(self.usage_history)
 
     def get_large_directories(
         self, root_path: str, min_size_mb: float = 100.0
@@ -206,16 +231,7 @@ class DiskMonitor:
         large_dirs = []
 
         try:
-            for dirpath, dirnames, filenames in os.walk(root_path):
-                # Calculate size
-                total_size = 0
-                for filename in filenames:
-                    file_path = os.path.join(dirpath, filename)
-                    try:
-                        total_size += os.path.getsize(file_path)
-                    except OSError:
-                        continue
-
+            for dirpath, total_size in self._walk_sizes(root_path):
                 # Convert to MB
                 size_mb = total_size / (1024**2)
 
@@ -250,20 +266,15 @@ class DiskMonitor:
             return {"slope": 0.0, "direction": "insufficient_data"}
 
         # Get recent measurements
-        recent = self.usage_history[-min(len(self.usage_history), 10) :]
+        start = max(len(self.usage_history) - 10, 0)
+        values = [u["usage_percent"] for u in islice(self.usage_history, start, None)]
 
-        # Calculate slope
-        values = [u["usage_percent"] for u in recent]
-        x = list(range(len(values)))
-
-        # Simple linear regression
+        # Least-squares slope over x = 0..n-1; the x sums have closed forms,
+        # so only sum(y) and sum(x*y) are accumulated
         n = len(values)
-        sum_x = sum(x)
-        sum_y = sum(values)
-        sum_xy = sum(xi * yi for xi, yi in zip(x, values))
-        sum_x2 = sum(xi**2 for xi in x)
-
-        slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x**2)
+        mean_x = (n - 1) / 2
+        sum_xy = sum(x * y for x, y in enumerate(values))
+        slope = (sum_xy - mean_x * sum(values)) / (n * (n * n - 1) / 12)
 
         # Determine direction
         if slope > 0.1:
@@ -289,7 +300,7 @@ class DiskMonitor:
             export_path: Path to export file
         """
         report = {
-            "usage_history": self.usage_history,
+            "usage_history": list(self.usage_history),
             "trend": self.get_usage_trend(),
             "threshold": self.threshold,
             "exported_at": datetime.now().isoformat(),
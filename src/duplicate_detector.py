@@ -10,6 +10,57 @@ import hashlib
 from typing import Dict, List, Optional
 from datetime import datetime
 import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+# Imported as src.duplicate_detector in tests, top-level from the CLI
+try:
+    from .file_scanner import hash_file as _hash_file
+except ImportError:
+    from file_scanner import hash_file as _hash_file
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# The hashers release the GIL while digesting, so I/O and hashing overlap
+HASH_WORKERS = min(32, (os.cpu_count() or 4) * 2)
+
+
+def _hash_files(files: List[str], new_hasher) -> Dict[str, List[str]]:
+    """Hash files on a thread pool and group paths by digest
+
+    Args:
+        files: Paths to hash
+        new_hasher: Zero-argument factory returning a fresh hasher
+
+    Returns:
+        Dictionary mapping digest to the paths with that digest, in input order
+    """
+
+    def hash_one(file_path: str) -> Optional[str]:
+        try:
+            return _hash_file(file_path, new_hasher())
+        except Exception as e:
+            print(f"⚠️  Error reading {file_path}: {e}")
+            return None
+
+    file_hashes = defaultdict(list)
+    if not files:
+        return file_hashes
+
+    with ThreadPoolExecutor(max_workers=min(HASH_WORKERS, len(files))) as ex:
+        for file_path, file_hash in zip(files, ex.map(hash_one, files)):
+            if file_hash is not None:
+                file_hashes[file_hash].append(file_path)
+
+    return file_hashes
 
 
 class DuplicateDetector:
@@ -31,37 +82,29 @@ class DuplicateDetector:
         print(f"🔍 Scanning {len(files)} files for duplicates...")
         start_time = time.time()
 
-        # Filter files by size threshold
-        files_to_scan = [f for f in files if os.path.getsize(f) > threshold]
+        # Filter files by size threshold, grouping by size on the way: a file
+        # with a unique size cannot have a duplicate, so it is never read
+        files_to_scan = []
+        by_size = defaultdict(list)
+        for f in files:
+            size = os.path.getsize(f)
+            if size > threshold:
+                files_to_scan.append(f)
+                by_size[size].append(f)
+        candidates = [f for group in by_size.values() if len(group) > 1 for f in group]
 
         # Choose hash algorithm
-        if use_xxhash:
-            try:
-                import xxhash
-
-                hash_func = lambda x: xxhash.xxh64(x).hexdigest()
-                algorithm = "xxhash"
-            except ImportError:
-                print("⚠️  xxHash not available, falling back to MD5")
-                hash_func = lambda x: hashlib.md5(x).hexdigest()
-                algorithm = "md5"
+        if use_xxhash and xxhash is not None:
+            new_hasher = xxhash.xxh3_64
+            algorithm = "xxhash"
         else:
-            hash_func = lambda x: hashlib.md5(x).hexdigest()
+            if use_xxhash:
+                print("⚠️  xxHash not available, falling back to MD5")
+            new_hasher = hashlib.md5
             algorithm = "md5"
 
         # Calculate hashes
-        file_hashes = {}
-        for file_path in files_to_scan:
-            try:
-                with open(file_path, "rb") as f:
-                    file_hash = hash_func(f.read())
-
-                if file_hash not in file_hashes:
-                    file_hashes[file_hash] = []
-                file_hashes[file_hash].append(file_path)
-            except Exception as e:
-                print(f"⚠️  Error reading {file_path}: {e}")
-                continue
+        file_hashes = _hash_files(candidates, new_hasher)
 
         # Find duplicates
         duplicates = {k: v for k, v in file_hashes.items() if len(v) > 1}
@@ -91,29 +134,17 @@ class DuplicateDetector:
         print(f"🔬 Verifying {len(files)} files...")
 
         # Use Blake3 if available, otherwise SHA256
-        if use_blake3:
-            try:
-                import hashlib
-
-                hash_func = lambda x: hashlib.sha256(x).hexdigest()
-                algorithm = "sha256"
-            except ImportError:
-                hash_func = lambda x: hashlib.sha256(x).hexdigest()
-                algorithm = "sha256"
+        if use_blake3 and blake3 is not None:
+            # Single-threaded per file: the pool already spreads files over
+            # the cores, and per-file fan-out would oversubscribe them
+            new_hasher = blake3.blake3
+            algorithm = "blake3"
+        else:
+            new_hasher = hashlib.sha256
+            algorithm = "sha256"
 
         # Calculate hashes
-        file_hashes = {}
-        for file_path in files:
-            try:
-                with open(file_path, "rb") as f:
-                    file_hash = hash_func(f.read())
-
-                if file_hash not in file_hashes:
-                    file_hashes[file_hash] = []
-                file_hashes[file_hash].append(file_path)
-            except Exception as e:
-                print(f"⚠️  Error reading {file_path}: {e}")
-                continue
+        file_hashes = _hash_files(files, new_hasher)
 
         # Group files by hash
         verified = {k: v for k, v in file_hashes.items() if len(v) > 1}
@@ -4,9 +4,35 @@ File Scanner with Progress Tracking
 
 import os
 import hashlib
-from typing import Dict, List, Optional, Callable
+from typing import Dict, Iterator, List, Optional, Callable, Tuple
 from datetime import datetime
 
+# Files are hashed in chunks this size so large files never sit in memory;
+# 128 KiB amortizes syscalls like coreutils cp
+CHUNK_SIZE = 1 << 17
+
+
+def hash_file(file_path: str, hasher) -> str:
+    """
+    Feed a file through hasher chunk by chunk and return the hex digest
+
+    Reads are unbuffered and land in one reused buffer: a single read()
+    syscall per chunk and no bytes object allocated per chunk.
+
+    Args:
+        file_path: Path to file
+        hasher: Fresh hashlib-style object with update() and hexdigest()
+
+    Returns:
+        Hex digest string
+    """
+    buf = bytearray(CHUNK_SIZE)
+    view = memoryview(buf)
+    with open(file_path, "rb", buffering=0) as f:
+        while n := f.readinto(buf):
+            hasher.update(view[:n])
+    return hasher.hexdigest()
+
 
 class FileScanner:
     """
@@ -62,78 +88,61 @@ class FileScanner:
 
         # Count files first for progress tracking
         if progress_callback:
-            for _ in os.walk(directory):
-                pass  # Just count
-            total_files = sum(1 for _ in os.walk(directory))
+            walk = self._walk(directory, recursive, include_hidden)
+            total_files = sum(1 for _ in walk)
             progress_callback(0, total_files)
 
-        # Walk directory
-        for dirpath, dirnames, filenames in os.walk(directory):
-            if not recursive and dirpath != directory:
+        # Normalize extensions once (handle both .txt and txt formats)
+        if extensions:
+            normalized_exts = {e if e.startswith(".") else f".{e}" for e in extensions}
+            ext_names = set(extensions)
+
+        for dirpath, entry in self._walk(directory, recursive, include_hidden):
+            _, ext = os.path.splitext(entry.name)
+            ext_lower = ext.lower()
+
+            # Filter by extension before touching the file's metadata
+            if extensions:
+                if (
+                    ext_lower not in normalized_exts
+                    and ext_lower.lstrip(".") not in ext_names
+                ):
+                    continue
+
+            # Get file info
+            try:
+                st = entry.stat()
+            except OSError as e:
+                print(f"⚠️  Error reading {entry.path}: {e}")
                 continue
 
-            # Filter out hidden directories
-            if not include_hidden:
-                dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            # Filter by size
+            size = st.st_size
+            size_kb = size / 1024
+            if min_size_kb is not None and size_kb < min_size_kb:
+                continue
+            if max_size_kb is not None and size_kb > max_size_kb:
+                continue
 
-            for filename in filenames:
-                # Skip hidden files
-                if not include_hidden and filename.startswith("."):
-                    continue
+            # Create result dict
+            result = {
+                "path": entry.path,
+                "name": entry.name,
+                "directory": dirpath,
+                "extension": ext_lower,
+                "size": size,
+                "size_kb": round(size_kb, 2),
+                "modified_time": datetime.fromtimestamp(st.st_mtime).isoformat(),
+            }
 
-                file_path = os.path.join(dirpath, filename)
-
-                # Get file info
-                try:
-                    size = os.path.getsize(file_path)
-                    _, ext = os.path.splitext(filename)
-                    ext_lower = ext.lower()
-                    ext_without_dot = ext_lower.lstrip(".")
-
-                    # Filter by extension (handle both .txt and txt formats)
-                    if extensions:
-                        # Normalize extensions - ensure they have dots
-                        normalized_exts = [
-                            e if e.startswith(".") else f".{e}" for e in extensions
-                        ]
-                        if (
-                            ext_lower not in normalized_exts
-                            and ext_without_dot not in extensions
-                        ):
-                            continue
-
-                    # Filter by size
-                    size_kb = size / 1024
-                    if min_size_kb is not None and size_kb < min_size_kb:
-                        continue
-                    if max_size_kb is not None and size_kb > max_size_kb:
-                        continue
+            results.append(result)
+            file_count += 1
+            self.total_files_scanned += 1
+            self.total_bytes_scanned += size
 
-                    # Create result dict
-                    result = {
-                        "path": file_path,
-                        "name": filename,
-                        "directory": dirpath,
-                        "extension": ext_lower,
-                        "size": size,
-                        "size_kb": round(size_kb, 2),
-                        "modified_time": datetime.fromtimestamp(
-                            os.path.getmtime(file_path)
-                        ).isoformat(),
-                    }
-
-                    results.append(result)
-                    file_count += 1
-                    self.total_files_scanned += 1
-                    self.total_bytes_scanned += size
-
-                    # Update progress
-                    if progress_callback and file_count % 10 == 0:
-                        progress_callback(file_count, total_files)
-
-                except OSError as e:
-                    print(f"⚠️  Error reading {file_path}: {e}")
-                    continue
+            # Update progress
+            if progress_callback and file_count % 10 == 0:
+                progress_callback(file_count, total_files)
 
         # Final progress update
         if progress_callback:
@@ -145,6 +154,45 @@ class FileScanner:
 
         return results
 
+    def _walk(
+        self, directory: str, recursive: bool, include_hidden: bool
+    ) -> Iterator[Tuple[str, os.DirEntry]]:
+        """
+        Yield file entries under a directory
+
+        Directories are listed with scandir off an explicit stack; the DirEntry
+        type bits come from readdir, so telling files from dirs needs no stat.
+        Symlinked directories are listed but not descended, like os.walk.
+
+        Args:
+            directory: Directory to walk
+            recursive: Whether to descend into subdirectories
+            include_hidden: Whether to yield and descend into dot entries
+
+        Returns:
+            Iterator of (parent directory, DirEntry) for non-directory entries
+        """
+        stack = [directory]
+        while stack:
+            dirpath = stack.pop()
+            try:
+                it = os.scandir(dirpath)
+            except OSError:
+                continue  # os.walk skips unreadable directories too
+
+            with it:
+                for entry in it:
+                    if not include_hidden and entry.name.startswith("."):
+                        continue
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        yield dirpath, entry
+                    elif recursive and not entry.is_symlink():
+                        stack.append(entry.path)
+
     def batch_scan(self, directories: List[str], **kwargs) -> List[Dict]:
         """
         Scan multiple directories
@@ -217,10 +265,7 @@ class FileScanner:
                 "sha256": hashlib.sha256,
             }.get(algorithm.lower(), hashlib.md5)
 
-            with open(file_path, "rb") as f:
-                checksum = hash_func(f.read()).hexdigest()
-
-            return checksum
+            return hash_file(file_path, hash_func())
 
         except Exception as e:
             print(f"⚠️  Error calculating checksum: {e}")
@@ -5,7 +5,7 @@ Google Drive API Integration
 import os
 import json
 import mimetypes
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from datetime import datetime
 
 
@@ -26,6 +26,15 @@ class GoogleDriveAPI:
     - Graceful handling without credentials
     """
 
+    # Most calls the Drive API accepts in one batch request
+    BATCH_LIMIT = 100
+
+    # Resumable uploads are sent in chunks this size (a multiple of 256 KiB)
+    UPLOAD_CHUNK_SIZE = 8 << 20
+
+    # Retries per chunk on transient (5xx/429) upload errors
+    UPLOAD_RETRIES = 3
+
     def __init__(self, credentials_path: Optional[str] = None):
         """
         Initialize Google Drive API
@@ -131,14 +140,20 @@ class GoogleDriveAPI:
         file_path: str,
         file_name: Optional[str] = None,
         folder_id: Optional[str] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
     ) -> Optional[str]:
         """
         Upload a file to Google Drive
 
+        The upload is resumable and sent in UPLOAD_CHUNK_SIZE chunks, so a
+        failed chunk is retried on its own instead of restarting the file.
+
         Args:
             file_path: Path to file to upload
             file_name: Custom file name (optional)
             folder_id: Parent folder ID (optional)
+            progress_callback: Function(bytes_sent, total_bytes) called after
+                each chunk (optional)
 
         Returns:
             File ID or None if failed
@@ -147,21 +162,33 @@ class GoogleDriveAPI:
             return None
 
         try:
+            from googleapiclient.http import MediaFileUpload
+
             file_metadata = {"name": file_name or os.path.basename(file_path)}
 
             if folder_id:
                 file_metadata["parents"] = [folder_id]
 
             media = MediaFileUpload(
-                file_path, mimetype=mimetypes.guess_type(file_path)[0]
+                file_path,
+                mimetype=mimetypes.guess_type(file_path)[0],
+                chunksize=self.UPLOAD_CHUNK_SIZE,
+                resumable=True,
             )
 
-            result = (
-                self.service.files()
-                .create(body=file_metadata, media_body=media, fields="id")
-                .execute()
+            request = self.service.files().create(
+                body=file_metadata, media_body=media, fields="id"
             )
 
+            result = None
+            while result is None:
+                status, result = request.next_chunk(num_retries=self.UPLOAD_RETRIES)
+                if status and progress_callback:
+                    progress_callback(status.resumable_progress, status.total_size)
+
+            if progress_callback:
+                progress_callback(media.size(), media.size())
+
             print(f"✓ Uploaded {file_metadata['name']} to Google Drive")
             return result.get("id")
 
@@ -348,12 +375,34 @@ class GoogleDriveAPI:
         Returns:
             List of success status for each file
         """
-        results = []
+        if not self._check_authenticated():
+            return [False] * len(file_ids)
+
+        results = [False] * len(file_ids)
+
+        def on_delete(request_id, response, exception):
+            index = int(request_id)
+            if exception is not None:
+                print(f"⚠️  Error deleting file {file_ids[index]}: {exception}")
+            else:
+                results[index] = True
+
+        # One HTTP round-trip per batch instead of one per file
+        for start in range(0, len(file_ids), self.BATCH_LIMIT):
+            batch = self.service.new_batch_http_request(callback=on_delete)
+            chunk = file_ids[start : start + self.BATCH_LIMIT]
+            for index, file_id in enumerate(chunk, start):
+                batch.add(
+                    self.service.files().delete(fileId=file_id),
+                    request_id=str(index),
+                )
 
-        for file_id in file_ids:
-            success = self.delete_file(file_id)
-            results.append(success)
+            try:
+                batch.execute()
+            except Exception as e:
+                print(f"⚠️  Error executing delete batch: {e}")
 
+        print(f"✓ Deleted {sum(results)}/{len(file_ids)} files")
         return results
 
     def get_storage_usage(self) -> Optional[Dict]:
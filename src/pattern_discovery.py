@@ -2,11 +2,46 @@
 Pattern Discovery Engine
 """
 
+import copy
 import os
 import re
-from typing import Dict, List
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
-from collections import Counter
+from collections import Counter, OrderedDict
+
+import numpy as np
+
+# Naming pattern regexes, compiled once at import
+_DATE_RE = re.compile(r"(\d{4}[_-]\d{2}[_-]\d{2})")
+_NUM_RE = re.compile(r"(\d{3,})")
+
+# Maps every ASCII digit to b"9" so digits can be counted with bytes.count
+_DIGIT_TBL = bytes.maketrans(b"0123456789", b"9" * 10)
+
+# Bucket edges for np.digitize; index i selects label i
+_SIZE_BINS = np.array([1024, 100 * 1024, 1024 * 1024, 10 * 1024 * 1024])
+_SIZE_LABELS = np.array(
+    [
+        "tiny (< 1KB)",
+        "small (1-100KB)",
+        "medium (100KB-1MB)",
+        "large (1-10MB)",
+        "very large (> 10MB)",
+    ]
+)
+_AGE_BINS = np.array([7, 30, 90, 365])
+_AGE_LABELS = np.array(
+    [
+        "recent (< 7 days)",
+        "week (7-30 days)",
+        "month (30-90 days)",
+        "quarter (90-365 days)",
+        "old (> 365 days)",
+    ]
+)
 
 
 class PatternDiscovery:
@@ -26,115 +61,122 @@ class PatternDiscovery:
     - Full pattern analysis
     """
 
-    def __init__(self):
-        """Initialize pattern discovery engine"""
+    _TEMP_EXTS = frozenset({".tmp", ".temp", ".bak", ".old", ".swp", "~"})
+
+    # Seconds a cached discover_all result stays valid, so age-based
+    # patterns never lag the clock by more than this
+    CACHE_TTL = 60.0
+
+    def __init__(self, cache_size: int = 128):
+        """
+        Initialize pattern discovery engine
+
+        Args:
+            cache_size: Number of discover_all results kept per instance
+        """
         self.discovered_patterns = {}
+        self.cache_size = cache_size
+        self._discover_cache: "OrderedDict[Tuple, Tuple[float, Dict]]" = OrderedDict()
 
-    def discover_naming_patterns(self, directory: str) -> List[Dict]:
+    def discover_naming_patterns(
+        self, directory: str, entries: Optional[List[os.DirEntry]] = None
+    ) -> List[Dict]:
         """
         Discover file naming patterns
 
         Args:
             directory: Directory to analyze
+            entries: Pre-scanned directory entries, skips listing directory
 
         Returns:
             List of pattern dicts with name, count, confidence
         """
-        if not os.path.isdir(directory):
-            return []
-
-        filenames = [
-            f
-            for f in os.listdir(directory)
-            if os.path.isfile(os.path.join(directory, f))
-        ]
+        if entries is None:
+            entries = self._list_entries(directory)
+            if entries is None:
+                return []
 
-        patterns = []
+        filenames = [entry.name for entry in entries if entry.is_file()]
 
-        # Extract patterns using regex
-        date_pattern = re.compile(r".*?(\d{4}[_-]\d{2}[_-]\d{2}).*?")
-        numbered_pattern = re.compile(r".*?(\d{3,}).*?")
+        aggregated = {}
 
         for filename in filenames:
-            name, ext = os.path.splitext(filename)
+            # Cheap digit count rejects names that cannot match either regex.
+            # It only sees ASCII digits, while \d also matches other Unicode
+            # digits, so non-ASCII names always go through the regexes
+            if filename.isascii():
+                digit_count = filename.encode("ascii").translate(_DIGIT_TBL).count(b"9")
+                if digit_count < 3:
+                    continue
+            else:
+                digit_count = len(filename)
 
             # Date patterns (e.g., report_2024_01_01)
-            match = date_pattern.match(filename)
-            if match:
-                base_name = filename.replace(match.group(1), "YYYY_MM_DD")
-                patterns.append(
-                    {
-                        "pattern": base_name,
-                        "type": "date",
-                        "confidence": 0.7,
-                        "examples": [filename],
-                    }
-                )
-                continue
-
-            # Numbered patterns (e.g., invoice_001)
-            match = numbered_pattern.match(filename)
+            match = _DATE_RE.search(filename) if digit_count >= 8 else None
             if match:
-                base_name = filename.replace(match.group(1), "###")
-                patterns.append(
-                    {
-                        "pattern": base_name,
-                        "type": "numbered",
-                        "confidence": 0.6,
-                        "examples": [filename],
-                    }
-                )
-                continue
-
-        # Aggregate similar patterns
-        aggregated = {}
-        for pattern in patterns:
-            key = pattern["pattern"]
-            if key not in aggregated:
-                aggregated[key] = pattern
-                aggregated[key]["count"] = 0
-            aggregated[key]["count"] += 1
-
-        # Update confidence based on count
-        for pattern in aggregated.values():
-            pattern["confidence"] = min(
-                0.99, pattern["confidence"] * (1 + pattern["count"] * 0.1)
-            )
-
-        return list(aggregated.values())
+                key = filename.replace(match.group(1), "YYYY_MM_DD")
+                pattern_type, confidence = "date", 0.7
+            else:
+                # Numbered patterns (e.g., invoice_001)
+                match = _NUM_RE.search(filename)
+                if not match:
+                    continue
+                key = filename.replace(match.group(1), "###")
+                pattern_type, confidence = "numbered", 0.6
+
+            # Aggregate similar patterns
+            entry = aggregated.get(key)
+            if entry is None:
+                aggregated[key] = {
+                    "pattern": key,
+                    "type": pattern_type,
+                    "confidence": confidence,
+                    "examples": [filename],
+                    "count": 1,
+                }
+            else:
+                entry["count"] += 1
+                entry["examples"].append(filename)
+
+        # Scale confidence by how often each pattern occurs
+        return [
+            {
+                **pattern,
+                "confidence": min(
+                    0.99, pattern["confidence"] * (1 + pattern["count"] * 0.1)
+                ),
+            }
+            for pattern in aggregated.values()
+        ]
 
-    def discover_organization_patterns(self, directory: str) -> Dict:
+    def discover_organization_patterns(
+        self, directory: str, entries: Optional[List[os.DirEntry]] = None
+    ) -> Dict:
         """
         Discover organization patterns
 
         Args:
             directory: Directory to analyze
+            entries: Pre-scanned directory entries, skips listing directory
 
         Returns:
             Dict with folder_structure and organization_score
         """
-        if not os.path.isdir(directory):
-            return {"folder_structure": [], "organization_score": 0}
-
-        folder_structure = []
-
-        for item in os.listdir(directory):
-            path = os.path.join(directory, item)
-
-            if os.path.isdir(path):
-                folder_structure.append(
-                    {
-                        "name": item,
-                        "type": "folder",
-                        "file_count": len(
-                            [
-                                f
-                                for f in os.listdir(path)
-                                if os.path.isfile(os.path.join(path, f))
-                            ]
-                        ),
-                    }
-                )
+        if entries is None:
+            entries = self._list_entries(directory)
+            if entries is None:
+                return {"folder_structure": [], "organization_score": 0}
+
+        folder_structure = [
+            {
+                "name": name,
+                "type": "folder",
+                "file_count": sum(1 for record in records if record[1]),
+            }
+            for name, (records, _) in self._scan_parallel(
+                directory, entries=entries
+            ).items()
+        ]
 
         # Calculate organization score
         total_items = len(folder_structure)
@@ -148,24 +190,25 @@ class PatternDiscovery:
             "organization_score": round(org_score, 2),
         }
 
-    def discover_duplicate_patterns(self, directory: str) -> Dict:
+    def discover_duplicate_patterns(
+        self, directory: str, entries: Optional[List[os.DirEntry]] = None
+    ) -> Dict:
         """
         Discover potential duplicate patterns
 
         Args:
             directory: Directory to analyze
+            entries: Pre-scanned directory entries, skips listing directory
 
         Returns:
             Dict with potential_duplicates and patterns
         """
-        if not os.path.isdir(directory):
-            return {"potential_duplicates": [], "patterns": []}
+        if entries is None:
+            entries = self._list_entries(directory)
+            if entries is None:
+                return {"potential_duplicates": [], "patterns": []}
 
-        files = [
-            f
-            for f in os.listdir(directory)
-            if os.path.isfile(os.path.join(directory, f))
-        ]
+        files = [entry.name for entry in entries if entry.is_file()]
 
         # Look for duplicate indicators
         duplicate_indicators = ["copy", "duplicate", "backup", "bak", "(1)", "(2)"]
@@ -186,105 +229,180 @@ class PatternDiscovery:
             "count": len(potential_duplicates),
         }
 
-    def discover_size_patterns(self, directory: str) -> Dict:
+    def _list_entries(self, directory: str) -> Optional[List[os.DirEntry]]:
         """
-        Discover file size patterns
+        List directory entries with a single scandir call
 
         Args:
-            directory: Directory to analyze
+            directory: Directory to list
 
         Returns:
-            Dict with size_distribution and statistics
+            List of DirEntry objects, or None if directory does not exist
         """
-        if not os.path.isdir(directory):
-            return {"size_distribution": []}
+        try:
+            with os.scandir(directory) as it:
+                return list(it)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+    def _collect_all(
+        self, directory: str, entries: Optional[List[os.DirEntry]] = None
+    ) -> Tuple[List[Tuple[str, bool, int, float]], Dict]:
+        """
+        Collect entry metadata in a single scandir pass, accumulating
+        file size statistics inline
 
-        files = [
-            os.path.join(directory, f)
-            for f in os.listdir(directory)
-            if os.path.isfile(os.path.join(directory, f))
-        ]
+        Args:
+            directory: Directory to scan
+            entries: Pre-scanned directory entries, skips listing directory
 
-        sizes = []
-        size_distribution = []
+        Returns:
+            Tuple of (name, is_file, size, mtime) records and size statistics
+        """
+        records = []
+        smin, smax, ssum, scount = sys.maxsize, 0, 0, 0
+
+        if entries is None:
+            with os.scandir(directory) as it:
+                entries = list(it)
 
-        for file_path in files:
+        for entry in entries:
             try:
-                size = os.path.getsize(file_path)
-                sizes.append(size)
-                size_kb = size / 1024
-
-                # Categorize size
-                if size_kb < 1:
-                    category = "tiny (< 1KB)"
-                elif size_kb < 100:
-                    category = "small (1-100KB)"
-                elif size_kb < 1024:
-                    category = "medium (100KB-1MB)"
-                elif size_kb < 10240:
-                    category = "large (1-10MB)"
-                else:
-                    category = "very large (> 10MB)"
-
-                size_distribution.append(
-                    {
-                        "file": os.path.basename(file_path),
-                        "size_bytes": size,
-                        "size_kb": round(size_kb, 2),
-                        "category": category,
-                    }
-                )
+                # Both follow symlinks, so a linked file reports its target
+                is_file = entry.is_file()
+                st = entry.stat()
             except OSError:
                 continue
 
-        # Calculate statistics
-        if sizes:
+            size = st.st_size
+            records.append((entry.name, is_file, size, st.st_mtime))
+
+            if is_file:
+                ssum += size
+                smin = size if size < smin else smin
+                smax = size if size > smax else smax
+                scount += 1
+
+        if scount:
             stats = {
-                "min_size": min(sizes),
-                "max_size": max(sizes),
-                "avg_size": sum(sizes) / len(sizes),
-                "total_size": sum(sizes),
+                "min_size": smin,
+                "max_size": smax,
+                "avg_size": ssum / scount,
+                "total_size": ssum,
             }
         else:
             stats = {}
 
+        return records, stats
+
+    def _scan_parallel(
+        self,
+        directory: str,
+        max_workers: int = 8,
+        entries: Optional[List[os.DirEntry]] = None,
+    ) -> Dict[str, Tuple[List[Tuple[str, bool, int, float]], Dict]]:
+        """
+        Run _collect_all over each top-level subdirectory concurrently
+
+        Threads overlap the scandir/stat syscalls, which release the GIL.
+
+        Args:
+            directory: Directory whose subdirectories are scanned
+            max_workers: Maximum number of scanner threads
+            entries: Pre-scanned directory entries, skips listing directory
+
+        Returns:
+            Dict mapping subdirectory name to its _collect_all result
+        """
+        if entries is None:
+            with os.scandir(directory) as it:
+                entries = list(it)
+
+        subdirs = [entry for entry in entries if entry.is_dir()]
+
+        if not subdirs:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                self._collect_all, [entry.path for entry in subdirs]
+            )
+            return {entry.name: result for entry, result in zip(subdirs, results)}
+
+    def discover_size_patterns(
+        self, directory: str, entries: Optional[List[os.DirEntry]] = None
+    ) -> Dict:
+        """
+        Discover file size patterns
+
+        Args:
+            directory: Directory to analyze
+            entries: Pre-scanned directory entries, skips listing directory
+
+        Returns:
+            Dict with size_distribution and statistics
+        """
+        if entries is None:
+            entries = self._list_entries(directory)
+            if entries is None:
+                return {"size_distribution": []}
+
+        records, stats = self._collect_all(directory, entries)
+        files = [(name, size) for name, is_file, size, _ in records if is_file]
+
+        sizes_arr = np.fromiter(
+            (size for _, size in files), dtype=np.int64, count=len(files)
+        )
+        categories = _SIZE_LABELS[np.digitize(sizes_arr, _SIZE_BINS)].tolist()
+
+        size_distribution = [
+            {
+                "file": name,
+                "size_bytes": size,
+                "size_kb": round(size / 1024, 2),
+                "category": category,
+            }
+            for (name, size), category in zip(files, categories)
+        ]
+
         return {"size_distribution": size_distribution, "statistics": stats}
 
-    def discover_temp_files(self, directory: str) -> Dict:
+    def discover_temp_files(
+        self, directory: str, entries: Optional[List[os.DirEntry]] = None
+    ) -> Dict:
         """
         Discover temporary or backup files
 
         Args:
             directory: Directory to analyze
+            entries: Pre-scanned directory entries, skips listing directory
 
         Returns:
             Dict with temp_files list
         """
-        if not os.path.isdir(directory):
-            return {"temp_files": []}
+        if entries is None:
+            entries = self._list_entries(directory)
+            if entries is None:
+                return {"temp_files": []}
 
-        temp_extensions = [".tmp", ".temp", ".bak", ".old", ".swp", "~"]
         temp_files = []
 
-        for item in os.listdir(directory):
-            # Check for temp extensions
-            name, ext = os.path.splitext(item)
+        for entry in entries:
+            item = entry.name
+            _, ext = os.path.splitext(item)
 
-            if ext.lower() in temp_extensions:
+            # Check for temp extensions
+            if ext.lower() in self._TEMP_EXTS:
                 temp_files.append(
                     {"filename": item, "type": "backup_temp", "indicator": ext}
                 )
-                continue
-
             # Check for leading dot (hidden)
-            if item.startswith("."):
+            elif item.startswith("."):
                 temp_files.append(
                     {"filename": item, "type": "hidden", "indicator": "leading_dot"}
                 )
-                continue
-
             # Check for trailing tilde
-            if item.endswith("~"):
+            elif item.endswith("~"):
                 temp_files.append(
                     {
                         "filename": item,
@@ -295,24 +413,25 @@ class PatternDiscovery:
 
         return {"temp_files": temp_files, "count": len(temp_files)}
 
-    def discover_type_distribution(self, directory: str) -> Dict:
+    def discover_type_distribution(
+        self, directory: str, entries: Optional[List[os.DirEntry]] = None
+    ) -> Dict:
         """
         Discover file type distribution
 
         Args:
             directory: Directory to analyze
+            entries: Pre-scanned directory entries, skips listing directory
 
         Returns:
             Dict with type_counts and most_common_type
         """
-        if not os.path.isdir(directory):
-            return {"type_counts": {}}
+        if entries is None:
+            entries = self._list_entries(directory)
+            if entries is None:
+                return {"type_counts": {}}
 
-        files = [
-            f
-            for f in os.listdir(directory)
-            if os.path.isfile(os.path.join(directory, f))
-        ]
+        files = [entry.name for entry in entries if entry.is_file()]
 
         type_counts = Counter()
 
@@ -330,69 +449,68 @@ class PatternDiscovery:
             "total_files": len(files),
         }
 
-    def discover_age_patterns(self, directory: str) -> Dict:
+    def discover_age_patterns(
+        self, directory: str, entries: Optional[List[os.DirEntry]] = None
+    ) -> Dict:
         """
         Discover file age patterns
 
         Args:
             directory: Directory to analyze
+            entries: Pre-scanned directory entries, skips listing directory
 
         Returns:
             Dict with age_distribution and statistics
         """
-        if not os.path.isdir(directory):
-            return {"age_distribution": []}
-
-        now = datetime.now()
-        age_distribution = []
-
-        for item in os.listdir(directory):
-            path = os.path.join(directory, item)
-
-            try:
-                mtime = os.path.getmtime(path)
-                file_date = datetime.fromtimestamp(mtime)
-                age_days = (now - file_date).days
-
-                # Categorize age
-                if age_days < 7:
-                    category = "recent (< 7 days)"
-                elif age_days < 30:
-                    category = "week (7-30 days)"
-                elif age_days < 90:
-                    category = "month (30-90 days)"
-                elif age_days < 365:
-                    category = "quarter (90-365 days)"
-                else:
-                    category = "old (> 365 days)"
-
-                age_distribution.append(
-                    {
-                        "filename": item,
-                        "age_days": age_days,
-                        "category": category,
-                        "modified_date": file_date.isoformat(),
-                    }
-                )
-            except OSError:
-                continue
+        if entries is None:
+            entries = self._list_entries(directory)
+            if entries is None:
+                return {"age_distribution": []}
+
+        now_ts = time.time()
+        records, _ = self._collect_all(directory, entries)
+
+        ages = [int((now_ts - mtime) // 86400) for _, _, _, mtime in records]
+        categories = _AGE_LABELS[np.digitize(ages, _AGE_BINS)].tolist()
+
+        age_distribution = [
+            {
+                "filename": name,
+                "age_days": age_days,
+                "category": category,
+                "modified_date": datetime.fromtimestamp(mtime).isoformat(),
+            }
+            for (name, _, _, mtime), age_days, category in zip(
+                records, ages, categories
+            )
+        ]
 
         return {"age_distribution": age_distribution, "count": len(age_distribution)}
 
-    def generate_recommendations(self, directory: str) -> List[Dict]:
+    def generate_recommendations(
+        self, directory: str, entries: Optional[List[os.DirEntry]] = None
+    ) -> List[Dict]:
         """
         Generate recommendations based on discovered patterns
 
         Args:
             directory: Directory to analyze
+            entries: Pre-scanned directory entries, skips listing directory
 
         Returns:
             List of recommendation dicts with action and priority
         """
+        if entries is None:
+            entries = self._list_entries(directory)
+            if entries is None:
+                return []
+
         recommendations = []
 
         # Check for temp files
-        temp_files = self.discover_temp_files(directory).get("temp_files", [])
+        temp_files = self.discover_temp_files(directory, entries).get(
+            "temp_files", []
+        )
         if len(temp_files) > 5:
             recommendations.append(
                 {
@@ -404,7 +522,7 @@ class PatternDiscovery:
             )
 
         # Check for duplicate patterns
-        dup_patterns = self.discover_duplicate_patterns(directory)
+        dup_patterns = self.discover_duplicate_patterns(directory, entries)
         if dup_patterns["count"] > 3:
             recommendations.append(
                 {
@@ -416,7 +534,7 @@ class PatternDiscovery:
             )
 
         # Check for disorganization
-        org_patterns = self.discover_organization_patterns(directory)
+        org_patterns = self.discover_organization_patterns(directory, entries)
         if org_patterns["organization_score"] < 0.3:
             recommendations.append(
                 {
@@ -433,20 +551,100 @@ class PatternDiscovery:
         """
         Discover all patterns at once
 
+        Results are cached by directory and a fingerprint of every entry's
+        (name, size, mtime_ns) for up to CACHE_TTL seconds, so repeat calls
+        only re-list the directory until an entry is added, removed, renamed
+        or rewritten. Each call gets its own copy with a fresh analyzed_at.
+
         Args:
             directory: Directory to analyze
 
         Returns:
             Dict with all pattern discoveries
         """
+        entries = self._list_entries(directory)
+        if entries is None:
+            return self._discover_all_impl(directory, None)
+
+        key = (os.path.abspath(directory), self._fingerprint(entries))
+        now = time.monotonic()
+        cached = self._discover_cache.get(key)
+
+        if cached is not None and now - cached[0] < self.CACHE_TTL:
+            self._discover_cache.move_to_end(key)
+            result = cached[1]
+        else:
+            result = self._discover_all_impl(directory, entries)
+            self._discover_cache[key] = (now, result)
+            self._discover_cache.move_to_end(key)
+            if len(self._discover_cache) > self.cache_size:
+                self._discover_cache.popitem(last=False)
+
+        # Callers get their own copy; the cached result is never handed out
+        result = copy.deepcopy(result)
+        result["analyzed_at"] = datetime.now().isoformat()
+        return result
+
+    def _fingerprint(self, entries: List[os.DirEntry]) -> int:
+        """
+        Hash the name, size and mtime of every entry
+
+        Args:
+            entries: Directory entries (their stat results are cached and
+                reused by the discoveries)
+
+        Returns:
+            Fingerprint that changes when any entry is added, removed or
+            rewritten
+        """
+        parts = []
+        for entry in entries:
+            try:
+                st = entry.stat()
+                parts.append((entry.name, st.st_size, st.st_mtime_ns))
+            except OSError:
+                parts.append((entry.name, -1, -1))
+        return hash(tuple(sorted(parts)))
+
+    def _discover_all_impl(
+        self, directory: str, entries: Optional[List[os.DirEntry]]
+    ) -> Dict:
+        """
+        Run every discovery over a single shared directory listing
+
+        Args:
+            directory: Directory to analyze
+            entries: Directory entries, or None if the directory is missing
+
+        Returns:
+            Dict with all pattern discoveries
+        """
+        if entries is None:
+            return {
+                "naming_patterns": [],
+                "organization_patterns": {
+                    "folder_structure": [],
+                    "organization_score": 0,
+                },
+                "duplicate_patterns": {"potential_duplicates": [], "count": 0},
+                "size_patterns": {"size_distribution": [], "statistics": {}},
+                "temp_files": {"temp_files": [], "count": 0},
+                "type_distribution": {"type_counts": {}},
+                "age_patterns": {"age_distribution": [], "count": 0},
+                "recommendations": [],
+                "analyzed_at": datetime.now().isoformat(),
+            }
+
         return {
-            "naming_patterns": self.discover_naming_patterns(directory),
-            "organization_patterns": self.discover_organization_patterns(directory),
-            "duplicate_patterns": self.discover_duplicate_patterns(directory),
-            "size_patterns": self.discover_size_patterns(directory),
-            "temp_files": self.discover_temp_files(directory),
-            "type_distribution": self.discover_type_distribution(directory),
-            "age_patterns": self.discover_age_patterns(directory),
-            "recommendations": self.generate_recommendations(directory),
+            "naming_patterns": self.discover_naming_patterns(directory, entries),
+            "organization_patterns": self.discover_organization_patterns(
+                directory, entries
+            ),
+            "duplicate_patterns": self.discover_duplicate_patterns(directory, entries),
+            "size_patterns": self.discover_size_patterns(directory, entries),
+            "temp_files": self.discover_temp_files(directory, entries),
+            "type_distribution": self.discover_type_distribution(directory, entries),
+            "age_patterns": self.discover_age_patterns(directory, entries),
+            "recommendations": self.generate_recommendations(directory, entries),
             "analyzed_at": datetime.now().isoformat(),
         }
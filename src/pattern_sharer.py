@@ -2,7 +2,8 @@
 Pattern Sharing - Export and import learning patterns
 
 Features:
-- Export patterns to JSON/YAML
+- Export patterns to JSON/JSONL/YAML
+- Streamed exports for large pattern sets
 - Import patterns from files
 - Share patterns between users
 - Pattern versioning
@@ -11,9 +12,34 @@ Features:
 import json
 import os
 from datetime import datetime
+from operator import itemgetter
 from typing import Any, Dict, List, Optional
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data: Any, indent: bool = True) -> bytes:
+    """Serialize data to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, indent=2).encode("utf-8")
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: Any) -> Any:
+    """Parse JSON str or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class PatternSharer:
     """Export and import learning patterns"""
@@ -34,6 +60,7 @@ class PatternSharer:
         name: str,
         format: str = "json",
         metadata: Optional[Dict] = None,
+        streaming: bool = False,
     ) -> str:
         """
         Export patterns to file
@@ -41,8 +68,10 @@ class PatternSharer:
         Args:
             patterns: List of pattern dictionaries
             name: Export name
-            format: Export format (json, yaml)
+            format: Export format (json, jsonl, yaml)
             metadata: Optional metadata
+            streaming: Write JSON one pattern at a time instead of
+                serializing the whole export in memory
 
         Returns:
             Path to exported file
@@ -51,20 +80,29 @@ class PatternSharer:
         filename = f"{name}_{timestamp}.{format}"
         filepath = os.path.join(self.patterns_dir, filename)
 
-        export_data = {
+        header = {
             "version": "1.0",
             "exported_at": datetime.now().isoformat(),
             "name": name,
             "pattern_count": len(patterns),
             "metadata": metadata or {},
-            "patterns": patterns,
         }
 
         try:
-            if format == "json":
-                with open(filepath, "w") as f:
-                    json.dump(export_data, f, indent=2)
+            if format == "json" and streaming:
+                with open(filepath, "wb") as f:
+                    self._write_streaming(f, header, patterns)
+            elif format == "json":
+                with open(filepath, "wb") as f:
+                    f.write(_dumps({**header, "patterns": patterns}))
+            elif format == "jsonl":
+                # Header line followed by one pattern per line
+                with open(filepath, "wb") as f:
+                    f.write(_dumps(header, indent=False) + b"\n")
+                    for pattern in patterns:
+                        f.write(_dumps(pattern, indent=False) + b"\n")
             elif format == "yaml":
+                export_data = {**header, "patterns": patterns}
                 import yaml
 
                 with open(filepath, "w") as f:
@@ -77,6 +115,17 @@ class PatternSharer:
             print(f"⚠️  Export error: {e}")
             return ""
 
+    def _write_streaming(self, f, header: Dict, patterns: List[Dict]):
+        """Write an export as JSON incrementally, one pattern at a time"""
+        # Reopen the header object to append the patterns array
+        f.write(_dumps(header, indent=False)[:-1])
+        f.write(b',"patterns":[')
+        for i, pattern in enumerate(patterns):
+            if i:
+                f.write(b",")
+            f.write(_dumps(pattern, indent=False))
+        f.write(b"]}")
+
     def import_patterns(
         self,
         filepath: str,
@@ -98,8 +147,12 @@ class PatternSharer:
 
         try:
             if filepath.endswith(".json"):
-                with open(filepath, "r") as f:
-                    data = json.load(f)
+                with open(filepath, "rb") as f:
+                    data = _loads(f.read())
+            elif filepath.endswith(".jsonl"):
+                with open(filepath, "rb") as f:
+                    f.readline()  # Skip header line
+                    data = {"patterns": [_loads(line) for line in f if line.strip()]}
             elif filepath.endswith(".yaml") or filepath.endswith(".yml"):
                 import yaml
 
@@ -125,12 +178,12 @@ class PatternSharer:
             "pattern_count": len(patterns),
             "patterns": patterns,
         }
-        return json.dumps(export_data, indent=2)
+        return _dumps(export_data).decode("utf-8")
 
     def import_from_clipboard(self, clipboard_data: str) -> List[Dict]:
         """Import patterns from clipboard"""
         try:
-            data = json.loads(clipboard_data)
+            data = _loads(clipboard_data)
             patterns = data.get("patterns", [])
             print(f"✓ Imported {len(patterns)} patterns from clipboard")
             return patterns
@@ -139,24 +192,25 @@ class PatternSharer:
             return []
 
     def list_exports(self) -> List[Dict]:
-        """List all pattern exports"""
+        """List all pattern exports, newest first"""
         exports = []
         if os.path.exists(self.patterns_dir):
-            for f in os.listdir(self.patterns_dir):
-                if f.endswith((".json", ".yaml", ".yml")):
-                    filepath = os.path.join(self.patterns_dir, f)
-                    stat = os.stat(filepath)
-                    exports.append(
-                        {
-                            "filename": f,
-                            "path": filepath,
-                            "size": stat.st_size,
-                            "modified": datetime.fromtimestamp(
-                                stat.st_mtime
-                            ).isoformat(),
-                        }
-                    )
-        return sorted(exports, key=lambda x: x["modified"], reverse=True)
+            with os.scandir(self.patterns_dir) as it:
+                for entry in it:
+                    if entry.name.endswith((".json", ".jsonl", ".yaml", ".yml")):
+                        stat = entry.stat()
+                        exports.append(
+                            {
+                                "filename": entry.name,
+                                "path": entry.path,
+                                "size": stat.st_size,
+                                "modified": stat.st_mtime,
+                                "modified_iso": datetime.fromtimestamp(
+                                    stat.st_mtime
+                                ).isoformat(),
+                            }
+                        )
+        return sorted(exports, key=itemgetter("modified"), reverse=True)
 
     def delete_export(self, filename: str) -> bool:
         """Delete an export file"""
@@ -5,10 +5,60 @@ Performance Monitoring System for tracking operation metrics
 import os
 import time
 import json
+from collections import deque
 from typing import Dict, List, Optional
 from datetime import datetime
 import psutil
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class _OperationTracker:
+    """Context manager recording the duration of a tracked operation"""
+
+    __slots__ = ("monitor", "name", "start_time")
+
+    def __init__(self, monitor, name):
+        self.monitor = monitor
+        self.name = name
+        self.start_time = None
+
+    def __enter__(self):
+        self.start_time = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        duration_ns = time.perf_counter_ns() - self.start_time
+
+        self.monitor._record_operation(self.name, duration_ns)
+        return False
+
+
+class _MemoryTracker:
+    """Context manager recording the RSS delta of a tracked operation"""
+
+    __slots__ = ("monitor", "name", "process", "start_memory")
+
+    def __init__(self, monitor, name):
+        self.monitor = monitor
+        self.name = name
+        self.process = monitor._process
+        self.start_memory = None
+
+    def __enter__(self):
+        self.start_memory = self.process.memory_info().rss / (1024 * 1024)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        end_memory = self.process.memory_info().rss / (1024 * 1024)
+        memory_delta = end_memory - self.start_memory
+
+        self.monitor._record_memory(self.name, memory_delta, end_memory)
+        return False
+
 
 class PerformanceMonitor:
     """
@@ -23,14 +73,18 @@ class PerformanceMonitor:
     - Metrics export to JSON
     """
 
-    def __init__(self, threshold: float = 1.0):
+    def __init__(self, threshold: float = 1.0, max_samples: int = 1000):
         """
         Initialize performance monitor
 
         Args:
             threshold: Performance threshold in seconds for alerts
+            max_samples: Number of recent timings kept per operation
         """
         self.threshold = threshold
+        self.threshold_ns = int(threshold * 1e9)
+        self.max_samples = max_samples
+        self._process = psutil.Process()
         self.operation_stats = {}
         self.memory_stats = {}
         self.alerts = []
@@ -45,56 +99,51 @@ class PerformanceMonitor:
         Yields:
             None
         """
+        return _OperationTracker(self, operation_name)
 
-        class OperationTracker:
-            def __init__(self, monitor, name):
-                self.monitor = monitor
-                self.name = name
-                self.start_time = None
-
-            def __enter__(self):
-                self.start_time = time.time()
-                return self
-
-            def __exit__(self, exc_type, exc_val, exc_tb):
-                end_time = time.time()
-                duration = end_time - self.start_time
-
-                self.monitor._record_operation(self.name, duration)
-                return False
-
-        return OperationTracker(self, operation_name)
-
-    def _record_operation(self, operation_name: str, duration: float):
-        """Record operation execution time"""
+    def _record_operation(self, operation_name: str, duration_ns: int):
+        """Record operation execution time in nanoseconds"""
         if operation_name not in self.operation_stats:
             self.operation_stats[operation_name] = {
                 "count": 0,
-                "total_time": 0,
-                "max_time": 0,
-                "min_time": float("inf"),
-                "times": [],
+                "total_ns": 0,
+                "max_ns": 0,
+                "min_ns": None,
+                "times": deque(maxlen=self.max_samples),
             }
 
         stats = self.operation_stats[operation_name]
         stats["count"] += 1
-        stats["total_time"] += duration
-        stats["max_time"] = max(stats["max_time"], duration)
-        stats["min_time"] = min(stats["min_time"], duration)
-        stats["average_time"] = stats["total_time"] / stats["count"]
-        stats["times"].append(duration)
+        stats["total_ns"] += duration_ns
+        if duration_ns > stats["max_ns"]:
+            stats["max_ns"] = duration_ns
+        if stats["min_ns"] is None or duration_ns < stats["min_ns"]:
+            stats["min_ns"] = duration_ns
+        stats["times"].append(duration_ns)
 
         # Check threshold
-        if duration > self.threshold:
+        if duration_ns > self.threshold_ns:
             self.alerts.append(
                 {
                     "operation": operation_name,
-                    "duration": duration,
+                    "duration": duration_ns / 1e9,
                     "threshold": self.threshold,
                     "timestamp": datetime.now().isoformat(),
                 }
             )
 
+    @staticmethod
+    def _format_operation_stats(stats: Dict) -> Dict:
+        """Convert raw nanosecond stats into seconds for reporting"""
+        return {
+            "count": stats["count"],
+            "total_time": stats["total_ns"] / 1e9,
+            "average_time": stats["total_ns"] / stats["count"] / 1e9,
+            "max_time": stats["max_ns"] / 1e9,
+            "min_time": stats["min_ns"] / 1e9,
+            "times": [t / 1e9 for t in stats["times"]],
+        }
+
     def track_memory(self, operation_name: str):
         """
         Context manager to track memory usage
@@ -105,26 +154,7 @@ class PerformanceMonitor:
         Yields:
             None
         """
-
-        class MemoryTracker:
-            def __init__(self, monitor, name):
-                self.monitor = monitor
-                self.name = name
-                self.process = psutil.Process()
-                self.start_memory = None
-
-            def __enter__(self):
-                self.start_memory = self.process.memory_info().rss / (1024 * 1024)
-                return self
-
-            def __exit__(self, exc_type, exc_val, exc_tb):
-                end_memory = self.process.memory_info().rss / (1024 * 1024)
-                memory_delta = end_memory - self.start_memory
-
-                self.monitor._record_memory(self.name, memory_delta, end_memory)
-                return False
-
-        return MemoryTracker(self, operation_name)
+        return _MemoryTracker(self, operation_name)
 
     def _record_memory(self, operation_name: str, delta_mb: float, peak_mb: float):
         """Record memory usage for operation"""
@@ -142,16 +172,17 @@ class PerformanceMonitor:
 
     def get_operation_stats(self, operation_name: str) -> Dict:
         """Get statistics for a specific operation"""
-        return self.operation_stats.get(
-            operation_name,
-            {
+        stats = self.operation_stats.get(operation_name)
+        if stats is None:
+            return {
                 "count": 0,
                 "total_time": 0,
                 "average_time": 0,
                 "max_time": 0,
                 "min_time": 0,
-            },
-        )
+            }
+
+        return self._format_operation_stats(stats)
 
     def get_memory_stats(self, operation_name: str) -> Dict:
         """Get memory statistics for a specific operation"""
@@ -189,14 +220,21 @@ class PerformanceMonitor:
         """Generate performance report"""
         system_metrics = self.get_system_metrics()
 
+        operations = {
+            name: self._format_operation_stats(stats)
+            for name, stats in self.operation_stats.items()
+        }
+
         # Calculate aggregate stats
         total_operations = sum(
             stats["count"] for stats in self.operation_stats.values()
         )
-        total_time = sum(stats["total_time"] for stats in self.operation_stats.values())
+        total_time = (
+            sum(stats["total_ns"] for stats in self.operation_stats.values()) / 1e9
+        )
 
         return {
-            "operations": self.operation_stats,
+            "operations": operations,
             "memory": self.memory_stats,
             "system_metrics": system_metrics,
             "alerts": self.alerts,
@@ -216,8 +254,11 @@ class PerformanceMonitor:
 
         os.makedirs(os.path.dirname(export_path), exist_ok=True)
 
-        with open(export_path, "w") as f:
-            json.dump(report, f, indent=2)
+        with open(export_path, "wb") as f:
+            if orjson is not None:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+            else:
+                f.write(json.dumps(report, indent=2).encode("utf-8"))
 
         print(f"✓ Metrics exported to {export_path}")
 
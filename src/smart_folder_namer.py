@@ -8,12 +8,24 @@ Features:
 - Custom naming conventions
 """
 
+import json
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
 from typing import Dict, List, Optional
 
+try:
+    from .semantic_analyzer import ext_of
+except ImportError:
+    from semantic_analyzer import ext_of
+
 
 class SmartFolderNamer:
     """LLM-powered folder naming assistant"""
 
+    # Seconds a check_connection() result is reused before probing again
+    CONNECTION_TTL = 30.0
+
     def __init__(self, ollama_model: str = "llama2"):
         """
         Initialize folder namer
@@ -22,6 +34,8 @@ class SmartFolderNamer:
             ollama_model: Ollama model to use
         """
         self.model = ollama_model
+        self._ollama = None
+        self._connection_state = (False, 0.0)
         self.naming_patterns = {
             "date_based": ["YYYY", "YYYY-MM", "YYYY-MM-DD", "MMM YYYY"],
             "type_based": ["Documents", "Images", "Videos", "Archives"],
@@ -29,6 +43,26 @@ class SmartFolderNamer:
             "context_based": ["Inbox", "Processed", "Pending", "Archive"],
         }
 
+    @property
+    def ollama(self):
+        """Shared OllamaIntegration client, created on first use"""
+        if self._ollama is None:
+            from ollama_integration import OllamaIntegration
+
+            self._ollama = OllamaIntegration()
+        return self._ollama
+
+    def _is_connected(self) -> bool:
+        """Check the Ollama connection, reusing the result for CONNECTION_TTL"""
+        connected, expires_at = self._connection_state
+        now = time.monotonic()
+        if now < expires_at:
+            return connected
+
+        connected = self.ollama.check_connection()
+        self._connection_state = (connected, now + self.CONNECTION_TTL)
+        return connected
+
     def suggest_folder_name(
         self,
         files: List[str],
@@ -46,16 +80,12 @@ class SmartFolderNamer:
         Returns:
             Dict with suggested name and alternatives
         """
-        from ollama_integration import OllamaIntegration
-
-        ollama = OllamaIntegration()
-
-        if not ollama.check_connection():
+        if not self._is_connected():
             return self._fallback_suggestion(files, style)
 
         # Build prompt
-        file_names = [f.split("/")[-1] for f in files[:10]]
-        file_types = [f.split(".")[-1] if "." in f else "unknown" for f in files[:10]]
+        file_names = [f.rpartition("/")[2] for f in files[:10]]
+        file_types = [ext_of(f)[1:] or "unknown" for f in files[:10]]
 
         prompt = f"""Analyze these files and suggest a concise folder name:
 
@@ -67,7 +97,7 @@ Style: {style}
 Return ONLY the best folder name (1-3 words, camelCase or snake_case)."""
 
         try:
-            response = ollama.generate(
+            response = self.ollama.generate(
                 prompt,
                 model=self.model,
                 max_tokens=20,
@@ -90,9 +120,6 @@ Return ONLY the best folder name (1-3 words, camelCase or snake_case)."""
 
     def _fallback_suggestion(self, files: List[str], style: str) -> Dict:
         """Fallback suggestion without LLM"""
-        file_names = [f.split("/")[-1] for f in files[:5]]
-        extensions = set(f.split(".")[-1].lower() for f in files if "." in f)
-
         # Detect primary type
         type_map = {
             "pdf": "Documents",
@@ -108,16 +135,14 @@ Return ONLY the best folder name (1-3 words, camelCase or snake_case)."""
             "md": "Notes",
         }
 
-        primary_type = "Mixed"
-        for ext in extensions:
-            if ext in type_map:
-                primary_type = type_map[ext]
-                break
+        # The most frequent known type wins
+        type_counts = Counter(
+            type_map[ext] for ext in (ext_of(f)[1:] for f in files) if ext in type_map
+        )
+        primary_type = type_counts.most_common(1)[0][0] if type_counts else "Mixed"
 
         suggested = primary_type
         if style == "date":
-            from datetime import datetime
-
             suggested = datetime.now().strftime("%Y-%m")
 
         return {
@@ -130,16 +155,14 @@ Return ONLY the best folder name (1-3 words, camelCase or snake_case)."""
     def _generate_alternatives(self, files: List[str], style: str) -> List[str]:
         """Generate alternative folder names"""
         alternatives = []
-        file_names = [f.split("/")[-1] for f in files[:3]]
 
         # Type-based alternatives
         type_alts = ["by_type", "categorized", "sorted", "organized"]
         alternatives.extend(type_alts[:2])
 
         # Date-based alternatives
-        from datetime import datetime
-
-        date_alts = [datetime.now().strftime("%Y"), datetime.now().strftime("%B")]
+        now = datetime.now()
+        date_alts = [now.strftime("%Y"), now.strftime("%B")]
         alternatives.extend(date_alts[:1])
 
         # Context-based
@@ -163,14 +186,10 @@ Return ONLY the best folder name (1-3 words, camelCase or snake_case)."""
         Returns:
             List of folder suggestions with files
         """
-        from ollama_integration import OllamaIntegration
-
-        ollama = OllamaIntegration()
-
-        if not ollama.check_connection():
+        if not self._is_connected():
             return self._fallback_structure(files, max_folders)
 
-        file_names = [f.split("/")[-1] for f in files[:15]]
+        file_names = [f.rpartition("/")[2] for f in files[:15]]
 
         prompt = f"""Group these files into up to {max_folders} folders and suggest folder names:
 
@@ -179,7 +198,7 @@ Files: {file_names}
 Return JSON array of {{folder_name, files}} structure."""
 
         try:
-            response = ollama.generate(
+            response = self.ollama.generate(
                 prompt,
                 model=self.model,
                 max_tokens=200,
@@ -187,8 +206,6 @@ Return JSON array of {{folder_name, files}} structure."""
             )
 
             if response:
-                import json
-
                 try:
                     structure = json.loads(response)
                     return structure
@@ -202,12 +219,9 @@ Return JSON array of {{folder_name, files}} structure."""
 
     def _fallback_structure(self, files: List[str], max_folders: int) -> List[Dict]:
         """Fallback structure without LLM"""
-        from collections import defaultdict
-
         extensions = defaultdict(list)
         for f in files:
-            ext = f.split(".")[-1].lower() if "." in f else "other"
-            extensions[ext].append(f)
+            extensions[ext_of(f)[1:] or "other"].append(f)
 
         type_map = {
             "pdf": "Documents",
@@ -229,7 +243,7 @@ Return JSON array of {{folder_name, files}} structure."""
             structure.append(
                 {
                     "folder_name": folder_name,
-                    "files": [f.split("/")[-1] for f in files_list],
+                    "files": [f.rpartition("/")[2] for f in files_list],
                 }
             )
 
@@ -8,20 +8,25 @@ Features:
 - Log rotation
 """
 
+import atexit
 import os
 import json
+import re
 import time
 import sched
 import threading
-import signal
 from datetime import datetime, timedelta
-from typing import Callable, Dict, List, Optional
-from pathlib import Path
+from typing import Dict, List, Optional
+
+_DELTA_RE = re.compile(r"(?:(\d+)d)?(?:(\d+)h)?(?:(\d+)m)?(?:(\d+)s)?")
 
 
 class TaskScheduler:
     """Task scheduler with cron-like syntax"""
 
+    # Seconds pending schedule changes are coalesced before being written
+    FLUSH_INTERVAL = 5.0
+
     def __init__(self, data_dir: str = "data"):
         """
         Initialize scheduler
@@ -35,6 +40,11 @@ class TaskScheduler:
         self.jobs: Dict[str, Dict] = {}
         self.running = False
         self.scheduler_thread: Optional[threading.Thread] = None
+        self._wakeup = threading.Event()
+        self._dirty = threading.Event()
+        self._save_lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+        self._closing = threading.Event()
         self._load_schedule()
 
     def _load_schedule(self) -> None:
@@ -48,14 +58,62 @@ class TaskScheduler:
                 self.jobs = {}
 
     def _save_schedule(self) -> None:
-        """Save scheduled jobs to file"""
-        os.makedirs(self.data_dir, exist_ok=True)
-        with open(self.schedule_file, "w") as f:
-            json.dump(
-                {"jobs": self.jobs, "saved_at": datetime.now().isoformat()},
-                f,
-                indent=2,
-            )
+        """Mark the schedule dirty; the flusher thread writes it out"""
+        self._dirty.set()
+        if self._flusher is None:
+            self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+            self._flusher.start()
+            # Don't lose changes made just before the process exits;
+            # close() unregisters this again
+            atexit.register(self.flush_schedule)
+
+    def _flush_loop(self) -> None:
+        """Write the schedule at most once per FLUSH_INTERVAL while it changes"""
+        while not self._closing.is_set():
+            self._dirty.wait()
+            if self._closing.is_set():
+                return
+            # Sleeps out the interval unless close() wakes it early
+            self._closing.wait(self.FLUSH_INTERVAL)
+            try:
+                self.flush_schedule()
+            except Exception as e:
+                print(f"⚠️  Error saving schedule: {e}")
+
+    def flush_schedule(self) -> None:
+        """Write pending schedule changes to file now"""
+        with self._save_lock:
+            if not self._dirty.is_set():
+                return
+            self._dirty.clear()
+
+            # Snapshot so the scheduler thread can't resize dicts mid-dump
+            jobs = {name: dict(job) for name, job in dict(self.jobs).items()}
+
+            # Write to a temp file and rename so readers never see a torn file
+            tmp_file = self.schedule_file + ".tmp"
+            try:
+                os.makedirs(self.data_dir, exist_ok=True)
+                with open(tmp_file, "w") as f:
+                    json.dump({"jobs": jobs, "saved_at": datetime.now().isoformat()}, f)
+                os.replace(tmp_file, self.schedule_file)
+            except Exception:
+                # Keep the changes pending so the next flush retries them
+                self._dirty.set()
+                if os.path.exists(tmp_file):
+                    os.unlink(tmp_file)
+                raise
+
+    def close(self) -> None:
+        """Write pending schedule changes and stop the flusher thread"""
+        flusher, self._flusher = self._flusher, None
+        if flusher is not None:
+            atexit.unregister(self.flush_schedule)
+            self._closing.set()
+            self._dirty.set()  # wake the flusher if it is idle
+            flusher.join()
+            self._closing.clear()
+        self.flush_schedule()
 
     def _parse_time(self, time_str: str) -> datetime:
         """Parse time string to datetime"""
@@ -73,10 +131,7 @@ class TaskScheduler:
 
     def _parse_delta(self, delta_str: str) -> timedelta:
         """Parse delta string (e.g., '1h30m', '2d')"""
-        import re
-
-        pattern = r"(?:(\d+)d)?(?:(\d+)h)?(?:(\d+)m)?(?:(\d+)s)?"
-        match = re.match(pattern, delta_str)
+        match = _DELTA_RE.match(delta_str)
         if match:
             days = int(match.group(1) or 0)
             hours = int(match.group(2) or 0)
@@ -185,6 +240,8 @@ class TaskScheduler:
                     self._run_job,
                     argument=(name,),
                 )
+                # Let the scheduler loop re-evaluate its next deadline
+                self._wakeup.set()
         except Exception as e:
             print(f"⚠️  Error scheduling job {name}: {e}")
 
@@ -230,6 +287,7 @@ class TaskScheduler:
             return
 
         self.running = True
+        self._wakeup.clear()
         self.scheduler_thread = threading.Thread(
             target=self._run_scheduler, daemon=True
         )
@@ -242,18 +300,31 @@ class TaskScheduler:
                 self._schedule_job(name)
 
     def _run_scheduler(self) -> None:
-        """Run the scheduler loop"""
+        """Run the scheduler loop, sleeping until the next job is due"""
         while self.running:
+            queue = self.scheduler.queue
+            if queue:
+                delay = max(0.0, queue[0].time - time.time())
+            else:
+                delay = 60.0
+
+            # Woken early by stop() or when a job is (re)scheduled
+            self._wakeup.wait(timeout=delay)
+            self._wakeup.clear()
+            if not self.running:
+                break
+
             try:
                 self.scheduler.run(blocking=False)
             except Exception:
                 pass
-            time.sleep(1)
 
     def stop(self) -> None:
         """Stop the scheduler"""
         self.running = False
+        self._wakeup.set()
         self.scheduler.empty()
+        self.close()
         print("✓ Scheduler stopped")
 
     def list_jobs(self) -> List[Dict]:
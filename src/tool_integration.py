@@ -2,12 +2,32 @@
 Tool Integration for fd, fzf, ripgrep, nnn
 """
 
+import functools
 import os
+import shutil
+import signal
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from datetime import datetime
 
+# `--version` output per tool, filled in by get_tool_info
+_tool_versions: Dict[str, str] = {}
+
+
+@functools.lru_cache(maxsize=32)
+def _which(tool_name: str) -> Optional[str]:
+    """Resolve a tool on PATH, memoized for the process lifetime"""
+    return shutil.which(tool_name)
+
+
+def reset_tool_cache():
+    """Forget cached tool lookups, e.g. after installing a tool"""
+    _which.cache_clear()
+    _tool_versions.clear()
+
 
 class ToolIntegration:
     """
@@ -23,14 +43,18 @@ class ToolIntegration:
     - Timeout handling
     """
 
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = 30, max_workers: Optional[int] = None):
         """
         Initialize tool integration
 
         Args:
             timeout: Default timeout for tool execution in seconds
+            max_workers: Maximum concurrent tool processes for batch searches
+                (default: two per CPU)
         """
         self.timeout = timeout
+        self.max_workers = max_workers
+        self._stats_lock = threading.Lock()
         self.execution_stats = {
             "total_executions": 0,
             "tool_counts": {},
@@ -48,13 +72,7 @@ class ToolIntegration:
         Returns:
             True if tool is available, False otherwise
         """
-        try:
-            result = subprocess.run(
-                ["which", tool_name], capture_output=True, timeout=5
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
+        return _which(tool_name) is not None
 
     def execute_tool(
         self, tool_name: str, args: List[str], timeout: Optional[int] = None
@@ -73,33 +91,68 @@ class ToolIntegration:
         timeout = timeout or self.timeout
 
         try:
-            self.execution_stats["total_executions"] += 1
-
-            if tool_name not in self.execution_stats["tool_counts"]:
-                self.execution_stats["tool_counts"][tool_name] = 0
-            self.execution_stats["tool_counts"][tool_name] += 1
-
-            result = subprocess.run(
-                [tool_name] + args, capture_output=True, text=True, timeout=timeout
+            # Batch searches run tools from several threads
+            with self._stats_lock:
+                self.execution_stats["total_executions"] += 1
+
+                if tool_name not in self.execution_stats["tool_counts"]:
+                    self.execution_stats["tool_counts"][tool_name] = 0
+                self.execution_stats["tool_counts"][tool_name] += 1
+
+            process = subprocess.Popen(
+                [tool_name, *args],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1 << 16,
+                start_new_session=True,
             )
 
-            if result.returncode == 0:
-                self.execution_stats["successful_executions"] += 1
-                output = result.stdout.strip().split("\n")
-                return output if output != [""] else []
+            # Reading the pipe blocks until every process holding it exits,
+            # so the timeout is enforced by killing the tool's whole process
+            # group (including any children it forked) from a timer thread
+            timed_out = threading.Event()
+
+            def kill():
+                timed_out.set()
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+
+            timer = threading.Timer(timeout, kill)
+            timer.start()
+            try:
+                with process.stdout:
+                    output = [line.rstrip("\n") for line in process.stdout]
+                returncode = process.wait()
+            finally:
+                timer.cancel()
+
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired([tool_name, *args], timeout)
+
+            if returncode == 0:
+                self._record_outcome("successful_executions")
+                return output
             else:
-                self.execution_stats["failed_executions"] += 1
+                self._record_outcome("failed_executions")
                 return None
 
         except subprocess.TimeoutExpired:
-            self.execution_stats["failed_executions"] += 1
+            self._record_outcome("failed_executions")
             print(f"⚠️  Tool {tool_name} timed out after {timeout}s")
             return None
         except Exception as e:
-            self.execution_stats["failed_executions"] += 1
+            self._record_outcome("failed_executions")
             print(f"⚠️  Error executing {tool_name}: {e}")
             return None
 
+    def _record_outcome(self, counter: str):
+        """Increment a success/failure counter in execution_stats"""
+        with self._stats_lock:
+            self.execution_stats[counter] += 1
+
     def fd_search(
         self,
         directory: str,
@@ -119,25 +172,14 @@ class ToolIntegration:
         Returns:
             List of matching file paths
         """
-        args = []
-
-        # Use '.' as default pattern (match all)
-        if pattern:
-            args.append(pattern)
-        else:
-            args.append(".")
-
-        if extension:
-            args.extend(["-e", extension])
-
-        if hidden:
-            args.append("--hidden")
-
-        # Always use absolute paths
-        args.append("-a")
-
-        # Directory is always the last argument
-        args.append(directory)
+        # '.' matches everything; always absolute paths; directory goes last
+        args = [
+            pattern or ".",
+            *(("-e", extension) if extension else ()),
+            *(("--hidden",) if hidden else ()),
+            "-a",
+            directory,
+        ]
 
         return self.execute_tool("fd", args) or []
 
@@ -155,23 +197,20 @@ class ToolIntegration:
         Returns:
             Selected item(s), or None if cancelled
         """
-        args = ["--prompt", prompt]
-
-        if multi:
-            args.append("--multi")
+        args = ["fzf", "--prompt", prompt, *(("--multi",) if multi else ())]
 
         try:
-            input_text = "\n".join(items)
+            # Hand fzf the items as bytes; only the selection gets decoded
+            input_bytes = "\n".join(items).encode("utf-8")
             result = subprocess.run(
-                ["fzf"] + args,
-                input=input_text,
+                args,
+                input=input_bytes,
                 capture_output=True,
-                text=True,
                 timeout=self.timeout,
             )
 
             if result.returncode == 0:
-                output = result.stdout.strip()
+                output = result.stdout.decode("utf-8", "replace").strip()
                 if multi:
                     return output.split("\n") if output else []
                 else:
@@ -202,16 +241,15 @@ class ToolIntegration:
         Returns:
             List of matching lines with file paths
         """
-        args = [pattern, directory]
-
         # ripgrep uses 'rg' as binary name
         tool_name = "rg"
 
-        if not case_sensitive:
-            args.append("-i")
-
-        if extensions:
-            args.extend(["-g", f"*.{','.join(extensions)}"])
+        args = [
+            pattern,
+            directory,
+            *(("-i",) if not case_sensitive else ()),
+            *(("-g", f"*.{','.join(extensions)}") if extensions else ()),
+        ]
 
         return self.execute_tool(tool_name, args) or []
 
@@ -248,12 +286,13 @@ class ToolIntegration:
 
     def reset_stats(self):
         """Reset execution statistics"""
-        self.execution_stats = {
-            "total_executions": 0,
-            "tool_counts": {},
-            "successful_executions": 0,
-            "failed_executions": 0,
-        }
+        with self._stats_lock:
+            self.execution_stats = {
+                "total_executions": 0,
+                "tool_counts": {},
+                "successful_executions": 0,
+                "failed_executions": 0,
+            }
 
     def batch_fd_search(
         self, directories: List[str], pattern: Optional[str] = None
@@ -261,6 +300,9 @@ class ToolIntegration:
         """
         Search multiple directories using fd
 
+        Each directory gets its own fd process; they run concurrently on up
+        to max_workers threads.
+
         Args:
             directories: List of directories to search
             pattern: Search pattern (optional)
@@ -268,15 +310,19 @@ class ToolIntegration:
         Returns:
             Dictionary mapping directories to search results
         """
-        results = {}
+        if not directories:
+            return {}
 
-        for directory in directories:
+        def search_one(directory: str) -> List[str]:
             if os.path.isdir(directory):
-                results[directory] = self.fd_search(directory, pattern)
-            else:
-                results[directory] = []
+                return self.fd_search(directory, pattern)
+            return []
 
-        return results
+        max_workers = self.max_workers or (os.cpu_count() or 1) * 2
+        max_workers = min(max_workers, len(directories))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(directories, executor.map(search_one, directories)))
 
     def get_tool_info(self, tool_name: str) -> Optional[Dict]:
         """
@@ -292,16 +338,28 @@ class ToolIntegration:
             return None
 
         try:
-            result = subprocess.run(
-                [tool_name, "--version"], capture_output=True, text=True, timeout=5
-            )
+            version = _tool_versions.get(tool_name)
+            if version is None:
+                # Only the first stdout line is kept; its own session keeps a
+                # hung tool from receiving the terminal's signals
+                result = subprocess.run(
+                    [tool_name, "--version"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    timeout=5,
+                    start_new_session=True,
+                )
+                if result.returncode == 0:
+                    first_line = result.stdout.split(b"\n", 1)[0]
+                    version = first_line.decode("utf-8", "replace").strip()
+                else:
+                    version = "unknown"
+                _tool_versions[tool_name] = version
 
             return {
                 "name": tool_name,
                 "available": True,
-                "version": result.stdout.strip()
-                if result.returncode == 0
-                else "unknown",
+                "version": version,
                 "checked_at": datetime.now().isoformat(),
             }
         except Exception:
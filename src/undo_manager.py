@@ -10,44 +10,200 @@ Features:
 
 import json
 import os
+import shutil
+import tempfile
+import time
+from collections import Counter, deque
 from datetime import datetime
+from itertools import islice
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Last formatted timestamp, reused while the clock stays in the same ms
+_now_cache = (0, "")
+
+
+def _now_iso() -> str:
+    """Current local time as ISO 8601, formatted at most once per ms"""
+    global _now_cache
+    now_ms = time.time_ns() // 1_000_000
+    if _now_cache[0] != now_ms:
+        _now_cache = (now_ms, datetime.fromtimestamp(now_ms / 1000).isoformat())
+    return _now_cache[1]
+
+
+def _dumps_line(obj: Dict) -> bytes:
+    """Serialize one log record as a JSON line"""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+        )
+    return (json.dumps(obj) + "\n").encode("utf-8")
+
+
+def _read_jsonl(path: str) -> List[Dict]:
+    """Read a JSON-lines log, skipping a torn or corrupt line"""
+    records = []
+    try:
+        with open(path, "rb") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def _trim_torn_tail(path: str) -> None:
+    """Truncate a log back to its last newline so appends start a fresh line"""
+    try:
+        with open(path, "rb+") as f:
+            size = f.seek(0, os.SEEK_END)
+            pos = size
+            while pos > 0:
+                step = min(4096, pos)
+                f.seek(pos - step)
+                chunk = f.read(step)
+                newline = chunk.rfind(b"\n")
+                if newline != -1:
+                    pos = pos - step + newline + 1
+                    break
+                pos -= step
+            if pos != size:
+                f.truncate(pos)
+    except FileNotFoundError:
+        pass
+
 
 class UndoManager:
     """Enhanced undo manager with selective rollback"""
 
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", max_history: int = 10_000):
         """
         Initialize undo manager
 
+        Actions are appended to undo_history.jsonl and status changes to
+        undo_status.jsonl, so recording or undoing never rewrites the log;
+        the status records are applied on load.
+
         Args:
             data_dir: Directory for undo data
+            max_history: Number of most recent actions kept in the recent
+                ring used for tail queries such as browse_history
         """
         self.data_dir = data_dir
-        self.history_file = os.path.join(data_dir, "undo_history.json")
+        self.history_file = os.path.join(data_dir, "undo_history.jsonl")
+        self.status_file = os.path.join(data_dir, "undo_status.jsonl")
         self.history: List[Dict] = []
+        # Action ID -> action and type -> actions; entries alias the dicts
+        # in self.history
+        self._by_id: Dict[int, Dict] = {}
+        self._by_type: Dict[str, List[Dict]] = {}
+        self.recent: deque = deque(maxlen=max_history)
+        self._append_fp = None
+        self._status_fp = None
+        # Never reused, so a delete backup keyed by action ID cannot be
+        # picked up by a later action after the history is cleared
+        self._next_id = 0
         self._load_history()
 
     def _load_history(self) -> None:
         """Load undo history from file"""
-        if os.path.exists(self.history_file):
+        legacy_file = os.path.join(self.data_dir, "undo_history.json")
+        if not os.path.exists(self.history_file) and os.path.exists(legacy_file):
+            # Migrate the old single-document format to the logs
             try:
-                with open(self.history_file, "r") as f:
-                    data = json.load(f)
-                    self.history = data.get("actions", [])
+                with open(legacy_file, "r") as f:
+                    self.history = json.load(f).get("actions", [])
             except Exception:
                 self.history = []
+            self._reindex()
+            self._next_id = self.history[-1]["id"] + 1 if self.history else 0
+            self._save_history()
+            return
+
+        # A crash mid-append leaves a fragment that the next append would
+        # otherwise be glued onto
+        _trim_torn_tail(self.history_file)
+        _trim_torn_tail(self.status_file)
+
+        # Compaction writes a {"next_id": ...} header ahead of the actions
+        self.history = []
+        for record in _read_jsonl(self.history_file):
+            if "id" in record:
+                self.history.append(record)
+            elif "next_id" in record:
+                self._next_id = max(self._next_id, record["next_id"])
+        if self.history:
+            self._next_id = max(self._next_id, self.history[-1]["id"] + 1)
+        self._reindex()
+
+        for update in _read_jsonl(self.status_file):
+            action = self._by_id.get(update.pop("id", None))
+            if action is not None:
+                action.update(update)
+
+    def _reindex(self) -> None:
+        """Rebuild the action ID and type indexes from self.history"""
+        self._by_id = {}
+        self._by_type = {}
+        for action in self.history:
+            self._by_id[action["id"]] = action
+            self._by_type.setdefault(action.get("type"), []).append(action)
+        self.recent.clear()
+        self.recent.extend(self.history[-self.recent.maxlen :])
+
+    def _close_logs(self) -> None:
+        """Close the append handles of both logs"""
+        for fp in (self._append_fp, self._status_fp):
+            if fp is not None:
+                fp.close()
+        self._append_fp = None
+        self._status_fp = None
+
+    def _append_record(self, record: Dict) -> None:
+        """Append one action to the history log"""
+        if self._append_fp is None:
+            os.makedirs(self.data_dir, exist_ok=True)
+            self._append_fp = open(self.history_file, "ab", buffering=0)
+        self._append_fp.write(_dumps_line(record))
+
+    def _append_status(self, update: Dict) -> None:
+        """Append one status change to the status log"""
+        if self._status_fp is None:
+            os.makedirs(self.data_dir, exist_ok=True)
+            self._status_fp = open(self.status_file, "ab", buffering=0)
+        self._status_fp.write(_dumps_line(update))
 
     def _save_history(self) -> None:
-        """Save undo history to file"""
+        """Rewrite the history log from memory and drop the status log"""
         os.makedirs(self.data_dir, exist_ok=True)
-        data = {
-            "actions": self.history,
-            "saved_at": datetime.now().isoformat(),
-        }
-        with open(self.history_file, "w") as f:
-            json.dump(data, f, indent=2)
+        self._close_logs()
+
+        buf = _dumps_line({"next_id": self._next_id}) + b"".join(
+            _dumps_line(action) for action in self.history
+        )
+
+        # Write to a temp file and rename so a crash never leaves a torn file
+        fd, tmp_file = tempfile.mkstemp(dir=self.data_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(buf)
+            os.replace(tmp_file, self.history_file)
+        except BaseException:
+            os.unlink(tmp_file)
+            raise
+
+        # Statuses are now part of the history log itself
+        if os.path.exists(self.status_file):
+            os.remove(self.status_file)
 
     def record_action(
         self,
@@ -68,18 +224,22 @@ class UndoManager:
         Returns:
             Action ID
         """
-        action_id = len(self.history)
+        action_id = self._next_id
+        self._next_id += 1
         action = {
             "id": action_id,
             "type": action_type,
             "source": source,
             "destination": destination,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "status": "executed",
             "metadata": metadata or {},
         }
         self.history.append(action)
-        self._save_history()
+        self._by_id[action_id] = action
+        self._by_type.setdefault(action_type, []).append(action)
+        self.recent.append(action)
+        self._append_record(action)
         return action_id
 
     def undo(
@@ -110,7 +270,7 @@ class UndoManager:
         failed = []
 
         for aid in action_ids:
-            action = next((a for a in self.history if a["id"] == aid), None)
+            action = self._by_id.get(aid)
             if not action:
                 failed.append({"id": aid, "error": "Not found"})
                 continue
@@ -133,7 +293,14 @@ class UndoManager:
                 success = self._execute_undo(action)
                 if success:
                     action["status"] = "undone"
-                    action["undone_at"] = datetime.now().isoformat()
+                    action["undone_at"] = _now_iso()
+                    self._append_status(
+                        {
+                            "id": aid,
+                            "status": action["status"],
+                            "undone_at": action["undone_at"],
+                        }
+                    )
                     undone.append(
                         {
                             "id": aid,
@@ -145,11 +312,14 @@ class UndoManager:
                 else:
                     failed.append({"id": aid, "error": "Undo failed"})
 
-        if not preview:
-            self._save_history()
+        if not failed:
+            status = "ok"
+        else:
+            status = "partial" if undone else "failed"
 
         return {
-            "success": True if len(failed) == 0 else partial,
+            "success": not failed,
+            "status": status,
             "undone_count": len(undone),
             "failed_count": len(failed),
             "undone": undone,
@@ -159,8 +329,6 @@ class UndoManager:
     def _execute_undo(self, action: Dict) -> bool:
         """Execute undo for a single action"""
         try:
-            import shutil
-
             if action["type"] == "move":
                 # Move back to source
                 if os.path.exists(action["destination"]):
@@ -183,8 +351,9 @@ class UndoManager:
             elif action["type"] == "delete":
                 # Restore from backup
                 backup_dir = os.path.join(self.data_dir, "backups")
+                backup_name = os.path.basename(action["source"])
                 backup_file = os.path.join(
-                    backup_dir, f'action_{action["id"]}_{os.path.basename(action["source"]}'
+                    backup_dir, f'action_{action["id"]}_{backup_name}'
                 )
                 if os.path.exists(backup_file):
                     shutil.copy2(backup_file, action["source"])
@@ -206,14 +375,16 @@ class UndoManager:
         offset: int = 0,
     ) -> List[Dict]:
         """Get undo history with filtering"""
-        filtered = self.history
+        # The type index keeps filtered pages O(limit) instead of O(history)
         if action_type:
-            filtered = [a for a in filtered if a.get("type") == action_type]
-        return filtered[offset : offset + limit]
+            actions = self._by_type.get(action_type, [])
+        else:
+            actions = self.history
+        return actions[offset : offset + limit]
 
     def get_action(self, action_id: int) -> Optional[Dict]:
         """Get a specific action"""
-        return next((a for a in self.history if a["id"] == action_id), None)
+        return self._by_id.get(action_id)
 
     def clear_history(self, before: Optional[datetime] = None) -> int:
         """Clear history, optionally before a date"""
@@ -225,27 +396,30 @@ class UndoManager:
             cleared = len(self.history)
             self.history = []
 
+        self._reindex()
         self._save_history()
         return cleared
 
     def get_statistics(self) -> Dict:
         """Get undo statistics"""
-        by_type = {}
-        for action in self.history:
-            t = action.get("type", "unknown")
-            by_type[t] = by_type.get(t, 0) + 1
+        # Type counts come straight from the index; statuses need one pass
+        by_type = {
+            "unknown" if t is None else t: len(actions)
+            for t, actions in self._by_type.items()
+        }
+        statuses = Counter(a.get("status") for a in self.history)
 
         return {
             "total_actions": len(self.history),
             "by_type": by_type,
-            "undone_count": sum(1 for a in self.history if a.get("status") == "undone"),
-            "executed_count": sum(1 for a in self.history if a.get("status") == "executed"),
+            "undone_count": statuses["undone"],
+            "executed_count": statuses["executed"],
         }
 
     def browse_history(self) -> str:
         """Generate readable history summary"""
         lines = ["=== Undo History ===", ""]
-        for action in reversed(self.history[-20:]):
+        for action in islice(reversed(self.recent), 20):
             status = "✓" if action.get("status") == "executed" else "↩️"
             timestamp = action.get("timestamp", "")[:19].replace("T", " ")
             lines.append(
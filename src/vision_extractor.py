@@ -10,12 +10,121 @@ Based on LlamaFS methodology:
 - Generates textual descriptions for semantic organization
 """
 
+import base64
+import hashlib
 import os
 import json
+import re
+import struct
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# HTTP session shared by all extractors so Ollama connections are kept alive
+_session = None
+
+
+def _get_session():
+    """Return the shared requests session, creating it on first use"""
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        # Default pool keeps 10 sockets per host; size it for parallel
+        # categorize_images workers so none fall back to a fresh connection
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["Connection"] = "keep-alive"
+        _session = session
+    return _session
+
+
+# JPEG start-of-frame markers; C4 (DHT), C8 (JPG) and CC (DAC) share the range
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _jpeg_dims(f) -> Optional[tuple]:
+    """Walk JPEG segment headers up to the first SOF marker"""
+    f.seek(2)
+    while True:
+        byte = f.read(1)
+        if byte != b"\xff":
+            return None
+        marker = f.read(1)
+        while marker == b"\xff":
+            marker = f.read(1)
+        if not marker:
+            return None
+        code = marker[0]
+        if code == 0x01 or 0xD0 <= code <= 0xD9:
+            continue
+        segment = f.read(2)
+        if len(segment) < 2 or code == 0xDA:
+            return None
+        (length,) = struct.unpack(">H", segment)
+        if code in _JPEG_SOF_MARKERS:
+            frame = f.read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack(">HH", frame[1:5])
+            return width, height
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+def _fast_dims(image_path: str) -> Optional[tuple]:
+    """
+    Read image dimensions from the file header without decoding
+
+    Args:
+        image_path: Path to image file
+
+    Returns:
+        (width, height) for PNG, JPEG, GIF and WEBP files, None otherwise
+    """
+    with open(image_path, "rb") as f:
+        data = f.read(32)
+
+        if data[:8] == b"\x89PNG\r\n\x1a\n" and data[12:16] == b"IHDR":
+            return struct.unpack(">II", data[16:24])
+
+        if data[:6] in (b"GIF87a", b"GIF89a"):
+            return struct.unpack("<HH", data[6:10])
+
+        if data[:4] == b"RIFF" and data[8:12] == b"WEBP" and len(data) >= 30:
+            chunk = data[12:16]
+            if chunk == b"VP8X":
+                width = int.from_bytes(data[24:27], "little") + 1
+                height = int.from_bytes(data[27:30], "little") + 1
+                return width, height
+            if chunk == b"VP8 " and data[23:26] == b"\x9d\x01\x2a":
+                width, height = struct.unpack("<HH", data[26:30])
+                return width & 0x3FFF, height & 0x3FFF
+            if chunk == b"VP8L" and data[20] == 0x2F:
+                bits = int.from_bytes(data[21:25], "little")
+                return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+            return None
+
+        if data[:2] == b"\xff\xd8":
+            return _jpeg_dims(f)
+
+    return None
+
 
 class VisionExtractor:
     """
@@ -28,17 +137,22 @@ class VisionExtractor:
     - Categorize by content type (people, nature, documents, etc.)
     """
 
-    SUPPORTED_IMAGE_FORMATS = {
-        ".jpg",
-        ".jpeg",
-        ".png",
-        ".gif",
-        ".bmp",
-        ".webp",
-        ".tiff",
-        ".tif",
-        ".svg",
-    }
+    SUPPORTED_IMAGE_FORMATS = frozenset(
+        {
+            ".jpg",
+            ".jpeg",
+            ".png",
+            ".gif",
+            ".bmp",
+            ".webp",
+            ".tiff",
+            ".tif",
+            ".svg",
+        }
+    )
+
+    # Directories never worth descending into when looking for images
+    SKIP_DIRS = frozenset({".git", "node_modules"})
 
     CATEGORY_KEYWORDS = {
         "people": ["person", "people", "portrait", "selfie", "group", "face", "crowd"],
@@ -83,8 +197,32 @@ class VisionExtractor:
         "art": ["art", "painting", "sculpture", "design", "creative", "architecture"],
     }
 
+    # All keywords in one pattern, in category order. The lookahead reports
+    # a match at every position, and at each position the alternation picks
+    # the earliest category, so the lowest-ranked match is the first
+    # category (in CATEGORY_KEYWORDS order) with any keyword in the name
+    _KEYWORD_PATTERN = re.compile(
+        "(?=({}))".format(
+            "|".join(
+                re.escape(keyword)
+                for keywords in CATEGORY_KEYWORDS.values()
+                for keyword in keywords
+            )
+        )
+    )
+    _CATEGORY_ORDER = tuple(CATEGORY_KEYWORDS)
+    # Built last-to-first so a keyword listed twice keeps its earliest rank
+    _KEYWORD_RANK = {
+        keyword: rank
+        for rank, keywords in reversed(list(enumerate(CATEGORY_KEYWORDS.values())))
+        for keyword in keywords
+    }
+
     def __init__(
-        self, ollama_url: str = "http://localhost:11434", model: str = "moondream"
+        self,
+        ollama_url: str = "http://localhost:11434",
+        model: str = "moondream",
+        cache_file: Optional[str] = None,
     ):
         """
         Initialize vision extractor
@@ -92,10 +230,54 @@ class VisionExtractor:
         Args:
             ollama_url: Ollama server URL
             model: Vision model name (moondream, llava, etc.)
+            cache_file: Optional JSONL file persisting vision model analyses,
+                keyed by image content so unchanged images are not re-sent
         """
         self.ollama_url = ollama_url
         self.model = model
         self._model_available = None
+        self.cache_file = cache_file
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._cache_lock = threading.Lock()
+        if cache_file:
+            self._load_cache()
+
+    def _load_cache(self):
+        """Load cached analyses from cache_file"""
+        try:
+            with open(self.cache_file, "r") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        self._cache[entry["key"]] = entry["analysis"]
+                    except (ValueError, KeyError, TypeError):
+                        # Skip a torn or malformed line
+                        continue
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"⚠️  Could not load vision cache: {e}")
+
+    def _content_key(self, image_path: str) -> str:
+        """Cache key from the model name and a hash of the image bytes"""
+        digest = xxhash.xxh3_128() if xxhash else hashlib.blake2b(digest_size=16)
+        with open(image_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return f"{self.model}:{digest.hexdigest()}"
+
+    def _remember(self, key: str, analysis: Dict[str, Any]):
+        """Cache an analysis in memory and append it to cache_file"""
+        with self._cache_lock:
+            self._cache[key] = analysis
+            if not self.cache_file:
+                return
+
+            cache_dir = os.path.dirname(self.cache_file)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            with open(self.cache_file, "a") as f:
+                f.write(json.dumps({"key": key, "analysis": analysis}) + "\n")
 
     def find_images(self, directory: str, recursive: bool = True) -> List[str]:
         """
@@ -109,19 +291,31 @@ class VisionExtractor:
             List of image file paths
         """
         images = []
-        dir_path = Path(directory)
-
-        if not dir_path.exists():
-            return images
-
-        pattern = "**/*" if recursive else "*"
-
-        for file_path in dir_path.glob(pattern):
-            if (
-                file_path.is_file()
-                and file_path.suffix.lower() in self.SUPPORTED_IMAGE_FORMATS
-            ):
-                images.append(str(file_path))
+        formats = self.SUPPORTED_IMAGE_FORMATS
+        pending = deque([directory])
+
+        while pending:
+            try:
+                it = os.scandir(pending.popleft())
+            except OSError:
+                continue
+
+            with it:
+                for entry in it:
+                    name = entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive and name not in self.SKIP_DIRS:
+                                pending.append(entry.path)
+                            continue
+
+                        # A leading dot marks a hidden file, not an extension
+                        dot = name.rfind(".")
+                        if dot > 0 and name[dot:].lower() in formats:
+                            if entry.is_file():
+                                images.append(entry.path)
+                    except OSError:
+                        continue
 
         return images
 
@@ -138,15 +332,22 @@ class VisionExtractor:
         if not os.path.exists(image_path):
             return {"error": "Image not found"}
 
-        # Try Ollama vision model
+        # Vision inference takes seconds; identical bytes give the same answer
         try:
-            import requests
-
-            # Read image as base64
-            import base64
+            cache_key = self._content_key(image_path)
+        except OSError:
+            cache_key = None
+        else:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return dict(cached)
 
+        # Try Ollama vision model
+        try:
+            # Encode the image once and serialize the body ourselves, so
+            # requests sends the bytes as-is instead of re-encoding a dict
             with open(image_path, "rb") as f:
-                image_data = base64.b64encode(f.read()).decode("utf-8")
+                image_data = base64.b64encode(f.read()).decode("ascii")
 
             # Use Moondream/LLaVA for vision analysis
             prompt = """Describe this image in detail. Include:
@@ -163,28 +364,36 @@ Format as JSON:
   "category": "primary category"
 }"""
 
-            response = requests.post(
-                f"{self.ollama_url}/api/generate",
-                json={
+            body = json.dumps(
+                {
                     "model": self.model,
                     "prompt": prompt,
                     "images": [image_data],
                     "stream": False,
                     "format": "json",
-                },
+                }
+            ).encode("ascii")
+
+            response = _get_session().post(
+                f"{self.ollama_url}/api/generate",
+                data=body,
+                headers={"Content-Type": "application/json"},
                 timeout=60,
             )
 
             if response.status_code == 200:
                 result = response.json()
                 analysis = json.loads(result.get("response", "{}"))
-                return {
+                analysis = {
                     "description": analysis.get("description", ""),
                     "tags": analysis.get("tags", []),
                     "category": analysis.get("category", "uncategorized"),
                     "confidence": 0.8,
                     "source": "ollama_vision",
                 }
+                if cache_key is not None:
+                    self._remember(cache_key, analysis)
+                return dict(analysis)
 
         except Exception:
             pass
@@ -207,12 +416,16 @@ Format as JSON:
         ]
 
         # Determine category from filename
-        category = "uncategorized"
-        filename_lower = filename.lower()
-        for cat, keywords in self.CATEGORY_KEYWORDS.items():
-            if any(kw in filename_lower for kw in keywords):
-                category = cat
-                break
+        best_rank = None
+        for match in self._KEYWORD_PATTERN.finditer(filename.lower()):
+            rank = self._KEYWORD_RANK[match.group(1)]
+            if best_rank is None or rank < best_rank:
+                best_rank = rank
+                if rank == 0:
+                    break
+        category = (
+            "uncategorized" if best_rank is None else self._CATEGORY_ORDER[best_rank]
+        )
 
         return {
             "description": f"Image file: {file_path.name}",
@@ -223,23 +436,40 @@ Format as JSON:
         }
 
     def categorize_images(
-        self, directory: str, recursive: bool = True
+        self,
+        directory: str,
+        recursive: bool = True,
+        max_concurrent: int = 4,
+        images: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Categorize all images in directory
 
+        Images are analyzed concurrently, since each analysis mostly waits
+        on the Ollama server.
+
         Args:
             directory: Path to scan
             recursive: Scan subdirectories
+            max_concurrent: Maximum number of in-flight image analyses
+            images: Pre-found image paths, skips scanning directory
 
         Returns:
             List of image categorizations with path, category, and confidence
         """
-        images = self.find_images(directory, recursive)
+        if images is None:
+            images = self.find_images(directory, recursive)
         results = []
 
-        for image_path in images:
-            analysis = self.analyze_image(image_path)
+        if not images:
+            return results
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_concurrent, len(images)))
+        ) as executor:
+            analyses = list(executor.map(self.analyze_image, images))
+
+        for image_path, analysis in zip(images, analyses):
             results.append(
                 {
                     "path": image_path,
@@ -254,49 +484,88 @@ Format as JSON:
 
         return results
 
-    def extract_image_metadata(self, image_path: str) -> Dict[str, Any]:
+    def extract_image_metadata(
+        self, image_path: str, include_info: bool = False
+    ) -> Dict[str, Any]:
         """
         Extract technical metadata from image
 
+        Dimensions of PNG, JPEG, GIF and WEBP files are read straight from
+        the header; Pillow is only opened for other formats (TIFF, BMP, ...)
+        or when include_info asks for the mode and embedded info dict.
+
         Args:
             image_path: Path to image file
+            include_info: Also report the Pillow mode and info (EXIF etc.)
 
         Returns:
             Dict with dimensions, format, size, etc.
         """
         file_path = Path(image_path)
 
-        if not file_path.exists():
+        try:
+            stat = file_path.stat()
+        except OSError:
             return {"error": "Image not found"}
 
-        stat = file_path.stat()
-
         metadata = {
             "file_path": str(file_path),
             "file_name": file_path.name,
             "file_size": stat.st_size,
             "format": file_path.suffix.lower(),
             "modified_time": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            "width": None,
+            "height": None,
         }
 
-        # Try to get image dimensions using Pillow
-        try:
-            from PIL import Image
+        if not include_info:
+            try:
+                dims = _fast_dims(image_path)
+            except (OSError, struct.error):
+                dims = None
+            if dims:
+                metadata["width"], metadata["height"] = dims
+                return metadata
 
+        # Fall back to Pillow for formats without a header parser
+        try:
             with Image.open(image_path) as img:
                 metadata["width"] = img.width
                 metadata["height"] = img.height
-                metadata["mode"] = img.mode
-                if hasattr(img, "info"):
+                if include_info:
+                    metadata["mode"] = img.mode
                     metadata["exif"] = img.info
 
         except Exception:
             # Pillow not available or can't read image
-            metadata["width"] = None
-            metadata["height"] = None
+            pass
 
         return metadata
 
+    def extract_image_metadata_batch(
+        self, image_paths: List[str], workers: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract metadata for many images concurrently
+
+        Opening and header-parsing each file is I/O-bound, so the reads
+        overlap on a thread pool.
+
+        Args:
+            image_paths: Paths to image files
+            workers: Maximum number of reader threads
+
+        Returns:
+            List of metadata dicts in image_paths order
+        """
+        if not image_paths:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(workers, len(image_paths)))
+        ) as executor:
+            return list(executor.map(self.extract_image_metadata, image_paths))
+
     def organize_images_by_category(
         self, directory: str, output_base: Optional[str] = None, recursive: bool = True
     ) -> Dict[str, List[str]]:
@@ -341,20 +610,14 @@ def get_vision_summary(directory: str) -> Dict[str, Any]:
     """
     extractor = VisionExtractor()
 
-    # Find all images
-    images = extractor.find_images(directory)
-
-    # Categorize
+    # Categorize (one directory walk; every found image is analyzed)
     categories = extractor.categorize_images(directory)
 
     # Aggregate by category
-    category_counts = {}
-    for cat in categories:
-        cat_name = cat["category"]
-        category_counts[cat_name] = category_counts.get(cat_name, 0) + 1
+    category_counts = dict(Counter(cat["category"] for cat in categories))
 
     return {
-        "total_images": len(images),
+        "total_images": len(categories),
         "category_distribution": category_counts,
         "analyzed_images": len(categories),
         "categories": categories[:10],  # Sample for display
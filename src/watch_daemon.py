@@ -9,19 +9,29 @@ Features:
 Based on LlamaFS methodology with watchdog integration and behavioral learning.
 """
 
+import atexit
+import fnmatch
 import os
 import re
 import json
+import mmap
 import time
 import queue
 import threading
 import shutil
-from pathlib import Path
-from typing import Dict, List, Optional, Any, Callable, Pattern
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, List, Optional, Any, Callable, Pattern, Tuple
 from datetime import datetime
 from dataclasses import dataclass, field
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class FileOperation(Enum):
     CREATE = "create"
@@ -31,17 +41,75 @@ class FileOperation(Enum):
     RENAME = "rename"
 
 
-@dataclass
+@dataclass(slots=True)
 class FileEvent:
     """Represents a filesystem event"""
 
     operation: FileOperation
     src_path: str
     dest_path: Optional[str] = None
-    timestamp: datetime = field(default_factory=datetime.now)
+    # Epoch seconds, like learned pattern timestamps
+    timestamp: float = field(default_factory=time.time)
     is_directory: bool = False
 
 
+def _dumps(data: Any) -> bytes:
+    """Serialize data to compact JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_atomic(path: str, payload: bytes) -> None:
+    """
+    Replace path with payload via a sibling temp file and rename
+
+    The rename is atomic, so readers see the old or the new file, never a
+    torn one. There is no fsync: writes are debounced already, and losing
+    the last few seconds on power loss is acceptable for learned data.
+    """
+    tmp_file = path + ".tmp"
+    try:
+        with open(tmp_file, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_file, path)
+    except BaseException:
+        # Don't leave a half-written temp file behind
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+        raise
+
+
+# HTTP session shared by all generators so Ollama connections are kept alive
+_session = None
+
+
+def _get_session():
+    """Return the shared requests session, creating it on first use"""
+    global _session
+    if _session is None:
+        import requests
+
+        _session = requests.Session()
+    return _session
+
+
+@lru_cache(maxsize=1024)
+def _glob_to_regex(pattern: str) -> Pattern[str]:
+    """Compile a learned filename glob into an anchored regex"""
+    regex = pattern.replace(".", "\\.").replace("*", ".*")
+    return re.compile(f"^{regex}$")
+
+
 class WatchDaemon:
     """
     Filesystem watch daemon using watchdog library
@@ -54,6 +122,9 @@ class WatchDaemon:
     - Non-blocking mode with callbacks
     """
 
+    # Repeat MODIFY events for a path within this many seconds are dropped
+    COALESCE_WINDOW = 0.25
+
     def __init__(
         self,
         watch_path: str,
@@ -62,6 +133,7 @@ class WatchDaemon:
         ignore_patterns: Optional[List[str]] = None,
         ignore_directories: bool = True,
         recursive: bool = True,
+        max_queue_size: Optional[int] = 10_000,
     ):
         """
         Initialize watch daemon
@@ -73,6 +145,9 @@ class WatchDaemon:
             ignore_patterns: Patterns to ignore
             ignore_directories: Ignore directory events
             recursive: Watch subdirectories
+            max_queue_size: Pending events kept before new ones are dropped;
+                the handler then gets one directory MODIFY event for
+                watch_path, meaning "rescan". None or 0 means unbounded
         """
         self.watch_path = watch_path
         self.event_handler = event_handler
@@ -81,10 +156,27 @@ class WatchDaemon:
         self.ignore_directories = ignore_directories
         self.recursive = recursive
 
+        # The polling fallback checks every file against the same globs the
+        # watchdog handler uses (case-insensitive); compile them once
+        self._compiled_patterns: List[Pattern[str]] = [
+            re.compile(fnmatch.translate(p), re.IGNORECASE) for p in (patterns or [])
+        ]
+        self._compiled_ignore_patterns: List[Pattern[str]] = [
+            re.compile(fnmatch.translate(p), re.IGNORECASE)
+            for p in (ignore_patterns or [])
+        ]
+
         self._running = False
         self._observer = None
-        self._event_queue = queue.Queue()
+        # SimpleQueue is C-implemented and cheaper per put/get, but can't
+        # be bounded
+        if max_queue_size:
+            self._event_queue = queue.Queue(maxsize=max_queue_size)
+        else:
+            self._event_queue = queue.SimpleQueue()
+        self._overflow = threading.Event()
         self._processing_thread = None
+        self._stop_hooks: List[Callable[[], None]] = []
 
     def start(self, blocking: bool = True) -> None:
         """
@@ -107,10 +199,17 @@ class WatchDaemon:
         # Try to use watchdog if available
         try:
             from watchdog.observers import Observer
-            from watchdog.events import FileSystemEventHandler
+            from watchdog.events import PatternMatchingEventHandler
 
-            class Handler(FileSystemEventHandler):
+            # Filter inside watchdog's dispatch so excluded files never
+            # reach the event queue
+            class Handler(PatternMatchingEventHandler):
                 def __init__(self, daemon):
+                    super().__init__(
+                        patterns=daemon.patterns,
+                        ignore_patterns=daemon.ignore_patterns,
+                        ignore_directories=daemon.ignore_directories,
+                    )
                     self.daemon = daemon
 
                 def on_created(self, event):
@@ -152,32 +251,192 @@ class WatchDaemon:
                     self.stop()
 
     def _start_observer(self) -> None:
-        """Start polling-based observer (fallback)"""
+        """Start inotify or polling-based observer (fallback)"""
         self._running = self._running or True
 
+        # Without watchdog, prefer kernel notifications over re-scanning
+        try:
+            from inotify_simple import INotify, flags
+
+            inotify = INotify()
+        except Exception:
+            # inotify_simple not installed, or not on Linux
+            inotify = None
+
+        if inotify is not None:
+            thread = threading.Thread(
+                target=self._watch_inotify, args=(inotify, flags), daemon=True
+            )
+            thread.start()
+            return
+
         def poll():
-            known_files = set()
+            # Per directory: (mtime_ns, included file names, subdirectories)
+            dir_state: Dict[str, Tuple[int, set, List[str]]] = {}
 
             while self._running:
-                try:
-                    for root, dirs, files in os.walk(self.watch_path):
-                        if not self.recursive and root != self.watch_path:
-                            continue
-
-                        for filename in files:
-                            if self._should_include(filename):
-                                filepath = os.path.join(root, filename)
-                                if filepath not in known_files:
-                                    known_files.add(filepath)
-                                    self._on_event(FileOperation.CREATE, filepath)
-                except Exception:
-                    pass
+                pending = [self.watch_path]
+                while pending:
+                    subdirs = self._scan_directory(pending.pop(), dir_state)
+                    if self.recursive:
+                        pending.extend(subdirs)
 
                 time.sleep(5)  # Poll every 5 seconds
 
         thread = threading.Thread(target=poll, daemon=True)
         thread.start()
 
+    def _watch_inotify(self, inotify, flags) -> None:
+        """
+        Dispatch inotify events until the daemon stops
+
+        Args:
+            inotify: inotify_simple.INotify instance, closed on exit
+            flags: inotify_simple.flags
+        """
+        mask = (
+            flags.CREATE
+            | flags.MODIFY
+            | flags.DELETE
+            | flags.MOVED_FROM
+            | flags.MOVED_TO
+        )
+        watches: Dict[int, str] = {}
+
+        def add_watches(path: str) -> None:
+            pending = [path]
+            while pending:
+                directory = pending.pop()
+                try:
+                    watches[inotify.add_watch(directory, mask)] = directory
+                except OSError:
+                    continue
+                if not self.recursive:
+                    continue
+                try:
+                    with os.scandir(directory) as it:
+                        for entry in it:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                except OSError:
+                    continue
+
+        add_watches(self.watch_path)
+
+        try:
+            while self._running:
+                # MOVED_FROM/MOVED_TO pairs share a cookie: (path, is_dir)
+                moved_from: Dict[int, Tuple[str, bool]] = {}
+
+                for event in inotify.read(timeout=1000):
+                    if event.mask & flags.IGNORED:
+                        watches.pop(event.wd, None)
+                        continue
+
+                    parent = watches.get(event.wd)
+                    if parent is None or not event.name:
+                        continue
+                    path = os.path.join(parent, event.name)
+                    is_dir = bool(event.mask & flags.ISDIR)
+
+                    if event.mask & flags.MOVED_FROM:
+                        moved_from[event.cookie] = (path, is_dir)
+                        continue
+
+                    if is_dir:
+                        old = moved_from.pop(event.cookie, None)
+                        if old is not None and event.mask & flags.MOVED_TO:
+                            # Renamed in place; existing watches move with it
+                            prefix = old[0] + os.sep
+                            for wd, watched in list(watches.items()):
+                                if watched == old[0]:
+                                    watches[wd] = path
+                                elif watched.startswith(prefix):
+                                    watches[wd] = path + watched[len(old[0]) :]
+                        elif self.recursive:
+                            add_watches(path)
+                        continue
+
+                    if event.mask & flags.MOVED_TO:
+                        old = moved_from.pop(event.cookie, None)
+                        if old is None:
+                            if self._should_include(event.name):
+                                self._on_event(FileOperation.CREATE, path)
+                        elif self._should_include(
+                            os.path.basename(old[0])
+                        ) or self._should_include(event.name):
+                            self._on_event(FileOperation.MOVE, old[0], path)
+                        continue
+
+                    if not self._should_include(event.name):
+                        continue
+                    if event.mask & flags.CREATE:
+                        self._on_event(FileOperation.CREATE, path)
+                    elif event.mask & flags.MODIFY:
+                        self._on_event(FileOperation.MODIFY, path)
+                    elif event.mask & flags.DELETE:
+                        self._on_event(FileOperation.DELETE, path)
+
+                # Moved out of the watched tree
+                for path, is_dir in moved_from.values():
+                    if not is_dir and self._should_include(os.path.basename(path)):
+                        self._on_event(FileOperation.DELETE, path)
+        finally:
+            inotify.close()
+
+    def _scan_directory(
+        self, path: str, dir_state: Dict[str, Tuple[int, set, List[str]]]
+    ) -> List[str]:
+        """
+        Report files created in path since the last poll
+
+        A directory's mtime only changes when entries are added, removed or
+        renamed in it, so unchanged directories are not listed again.
+
+        Args:
+            path: Directory to scan
+            dir_state: Poll state, updated in place
+
+        Returns:
+            Subdirectories of path to scan next
+        """
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            dir_state.pop(path, None)
+            return []
+
+        state = dir_state.get(path)
+        if state is not None and state[0] == mtime:
+            return state[2]
+
+        names = []
+        subdirs = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir():
+                            # Like os.walk, don't descend into symlinked dirs
+                            if not entry.is_symlink():
+                                subdirs.append(entry.path)
+                            continue
+                    except OSError:
+                        continue
+                    if self._should_include(entry.name):
+                        names.append(entry.name)
+        except OSError:
+            return []
+
+        known = state[1] if state is not None else set()
+        dir_state[path] = (mtime, set(names), subdirs)
+
+        for name in names:
+            if name not in known:
+                self._on_event(FileOperation.CREATE, os.path.join(path, name))
+
+        return subdirs
+
     def stop(self) -> None:
         """Stop watching"""
         self._running = False
@@ -186,6 +445,28 @@ class WatchDaemon:
             self._observer.stop()
             self._observer.join()
 
+        # Let an in-flight dispatch finish before the hooks tear down what
+        # the handler uses; None only wakes the processing thread
+        thread = self._processing_thread
+        if thread is not None and thread is not threading.current_thread():
+            try:
+                self._event_queue.put_nowait(None)
+            except queue.Full:
+                pass
+            thread.join()
+
+        for hook in self._stop_hooks:
+            hook()
+
+    def add_stop_hook(self, hook: Callable[[], None]) -> None:
+        """
+        Register a callback run after the daemon stops watching
+
+        Args:
+            hook: Called with no arguments at the end of every stop()
+        """
+        self._stop_hooks.append(hook)
+
     def is_running(self) -> bool:
         """Check if daemon is running"""
         return self._running
@@ -196,40 +477,73 @@ class WatchDaemon:
         """Handle file event"""
         event = FileEvent(operation=operation, src_path=src_path, dest_path=dest_path)
 
-        # Add to queue
-        self._event_queue.put(event)
-
-        # Call handler
-        if self.event_handler:
-            try:
-                self.event_handler(event)
-            except Exception:
-                pass
+        # Add to queue; the handler runs on the processing thread. When the
+        # handler falls behind, drop events instead of buffering without bound
+        try:
+            self._event_queue.put_nowait(event)
+        except queue.Full:
+            self._overflow.set()
 
     def _process_events(self) -> None:
         """Process events from queue"""
+        # A single write typically arrives as CREATE + MODIFY + MODIFY; the
+        # first event is delivered and MODIFYs inside the window are dropped
+        last_seen: Dict[str, float] = {}
+
         while self._running:
+            if self._overflow.is_set() and self._event_queue.empty():
+                # Events were dropped; one directory event stands in for them
+                self._overflow.clear()
+                self._dispatch(
+                    FileEvent(
+                        operation=FileOperation.MODIFY,
+                        src_path=self.watch_path,
+                        is_directory=True,
+                    )
+                )
+
             try:
                 event = self._event_queue.get(timeout=1)
-
-                if self.event_handler:
-                    self.event_handler(event)
-
             except queue.Empty:
                 continue
+
+            if event is None:
+                continue
+
+            now = time.monotonic()
+            if event.operation is FileOperation.MODIFY:
+                seen = last_seen.get(event.src_path)
+                if seen is not None and now - seen < self.COALESCE_WINDOW:
+                    continue
+
+            if event.operation is FileOperation.DELETE:
+                last_seen.pop(event.src_path, None)
+            else:
+                last_seen[event.dest_path or event.src_path] = now
+
+            if len(last_seen) > 1024:
+                cutoff = now - self.COALESCE_WINDOW
+                last_seen = {p: t for p, t in last_seen.items() if t >= cutoff}
+
+            self._dispatch(event)
+
+    def _dispatch(self, event: FileEvent) -> None:
+        """Call the event handler, ignoring its errors"""
+        if self.event_handler:
+            try:
+                self.event_handler(event)
             except Exception:
                 pass
 
     def _should_include(self, filename: str) -> bool:
         """Check if file should be included"""
-        if self.ignore_patterns:
-            for pattern in self.ignore_patterns:
-                if re.match(pattern, filename):
-                    return False
-
-        if self.patterns:
-            for pattern in self.patterns:
-                if re.match(pattern, filename):
+        for pattern in self._compiled_ignore_patterns:
+            if pattern.match(filename):
+                return False
+
+        if self._compiled_patterns:
+            for pattern in self._compiled_patterns:
+                if pattern.match(filename):
                     return True
             return False
 
@@ -247,6 +561,21 @@ class FolderStructureGenerator:
     - Generates destination paths with new folder names
     """
 
+    # Files listed per LLM prompt
+    LLM_BATCH_SIZE = 20
+
+    # Checked in order; a filename goes to the first category with a hit
+    CATEGORY_KEYWORDS = {
+        "work": ["report", "invoice", "presentation", "meeting", "work", "office"],
+        "personal": ["photo", "vacation", "family", "personal", "medical"],
+        "projects": ["project", "code", "development", "github"],
+        "archives": ["old", "archive", "backup", "2023", "2022"],
+    }
+    _CATEGORY_RES = {
+        cat: re.compile("|".join(map(re.escape, keywords)))
+        for cat, keywords in CATEGORY_KEYWORDS.items()
+    }
+
     DEFAULT_PROMPT = """
 You will be provided with a list of files and their content summaries.
 Propose an optimal folder structure for organizing these files.
@@ -281,6 +610,10 @@ Response must be JSON with schema:
         """
         self.ollama_url = ollama_url
         self.model = model
+        self._endpoint = f"{ollama_url}/api/generate"
+        # Request fields that are the same for every batch
+        self._prompt_prefix = self.DEFAULT_PROMPT + "\n\nFiles:\n"
+        self._base_payload = {"model": model, "stream": True, "format": "json"}
 
     def propose_structure(
         self,
@@ -314,20 +647,36 @@ Response must be JSON with schema:
     def _get_file_summaries(self, directory: str) -> List[Dict]:
         """Get basic file summaries"""
         summaries = []
+        pending = deque([directory])
 
-        for root, dirs, files in os.walk(directory):
-            for filename in files:
-                filepath = os.path.join(root, filename)
-                stat = os.stat(filepath)
-
-                summaries.append(
-                    {
-                        "src_path": filepath,
-                        "file_name": filename,
-                        "size": stat.st_size,
-                        "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                    }
-                )
+        while pending:
+            try:
+                it = os.scandir(pending.popleft())
+            except OSError:
+                continue
+
+            with it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                            continue
+                        if not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+
+                    summaries.append(
+                        {
+                            "src_path": entry.path,
+                            "file_name": entry.name,
+                            "size": stat.st_size,
+                            "modified": datetime.fromtimestamp(
+                                stat.st_mtime
+                            ).isoformat(),
+                        }
+                    )
 
         return summaries
 
@@ -341,19 +690,12 @@ Response must be JSON with schema:
             "uncategorized": [],
         }
 
-        category_keywords = {
-            "work": ["report", "invoice", "presentation", "meeting", "work", "office"],
-            "personal": ["photo", "vacation", "family", "personal", "medical"],
-            "projects": ["project", "code", "development", "github"],
-            "archives": ["old", "archive", "backup", "2023", "2022"],
-        }
-
         for f in files:
             filename = f["file_name"].lower()
             categorized = False
 
-            for cat, keywords in category_keywords.items():
-                if any(kw in filename for kw in keywords):
+            for cat, keyword_re in self._CATEGORY_RES.items():
+                if keyword_re.search(filename):
                     categories[cat].append(f)
                     categorized = True
                     break
@@ -385,37 +727,54 @@ Response must be JSON with schema:
 
     def _query_llm(self, files: List[Dict]) -> Dict[str, Any]:
         """Query LLM for smart categorization"""
-        try:
-            import requests
+        result_files = []
+
+        # Limit each prompt to avoid token limits, but cover every file
+        for start in range(0, len(files), self.LLM_BATCH_SIZE):
+            batch = files[start : start + self.LLM_BATCH_SIZE]
+            result = self._query_llm_batch(batch)
+
+            if result is None:
+                # Fallback to basic
+                result = self._basic_categorization(batch)
+
+            result_files.extend(result.get("files", []))
+
+        return {"files": result_files}
 
+    def _query_llm_batch(self, files: List[Dict]) -> Optional[Dict[str, Any]]:
+        """Ask the LLM to place one batch of files, None on failure"""
+        try:
             # Prepare file list for LLM
             file_list = "\n".join(
-                [
-                    f"- {f['src_path']}: {f.get('summary', f['file_name'])}"
-                    for f in files[:20]  # Limit to avoid token limits
-                ]
+                f"- {f['src_path']}: {f.get('summary', f['file_name'])}" for f in files
             )
 
-            response = requests.post(
-                f"{self.ollama_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": self.DEFAULT_PROMPT + "\n\nFiles:\n" + file_list,
-                    "stream": False,
-                    "format": "json",
-                },
+            # Stream the answer so tokens are read as Ollama produces them
+            # instead of waiting for the server to buffer the whole reply
+            with _get_session().post(
+                self._endpoint,
+                json={**self._base_payload, "prompt": self._prompt_prefix + file_list},
+                stream=True,
                 timeout=60,
-            )
-
-            if response.status_code == 200:
-                result = response.json()
-                return json.loads(result.get("response", '{"files": []}'))
+            ) as response:
+                if response.status_code != 200:
+                    return None
+
+                parts = []
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = _loads(line)
+                    parts.append(chunk.get("response", ""))
+                    if chunk.get("done"):
+                        break
+
+            result = json.loads("".join(parts) or '{"files": []}')
+            return result if isinstance(result, dict) else None
 
         except Exception:
-            pass
-
-        # Fallback to basic
-        return self._basic_categorization(files)
+            return None
 
 
 class FileOperationLearner:
@@ -429,6 +788,11 @@ class FileOperationLearner:
     - Improves from user feedback
     """
 
+    FLUSH_INTERVAL = 2.0
+    MAX_FEEDBACK = 1000
+    # Below this size a plain read is cheaper than setting up a mapping
+    MMAP_THRESHOLD = 1 << 20
+
     def __init__(self, data_file: str = "data/learning-data.json"):
         """
         Initialize learning system
@@ -439,36 +803,127 @@ class FileOperationLearner:
         self.data_file = data_file
         self._ensure_data_file()
 
-        self.patterns = self._load_patterns()
-        self.feedback_history = []
+        data = self._load_data()
+        self.patterns = data.get("patterns", [])
+        # Only recent feedback is ever read back, so keep the file bounded
+        self.feedback_history = deque(
+            data.get("feedback", []), maxlen=self.MAX_FEEDBACK
+        )
+        self._pattern_index: Dict[Tuple[str, Optional[str]], Dict] = {}
+        # Local move patterns by src_pattern, as (position in patterns, pattern)
+        self._by_src_pattern: Dict[str, List[Tuple[int, Dict]]] = {}
+        self._src_pattern_lengths: set = set()
+        self._build_pattern_index()
+
+        # Events arrive from watcher threads; _lock guards patterns and
+        # feedback, _save_lock serializes writers of data_file
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._dirty = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._closing = threading.Event()
 
     def _ensure_data_file(self) -> None:
         """Ensure data file exists"""
         os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
         if not os.path.exists(self.data_file):
-            with open(self.data_file, "w") as f:
-                json.dump({"patterns": [], "feedback": []}, f)
+            _write_atomic(self.data_file, _dumps({"patterns": [], "feedback": []}))
 
-    def _load_patterns(self) -> List[Dict]:
-        """Load patterns from file"""
+    def _load_data(self) -> Dict[str, List[Dict]]:
+        """Load patterns and feedback from file"""
         try:
-            with open(self.data_file, "r") as f:
-                data = json.load(f)
-                return data.get("patterns", [])
+            with open(self.data_file, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if orjson is None or size < self.MMAP_THRESHOLD:
+                    return _loads(f.read())
+
+                # orjson parses straight from the mapped pages, skipping the
+                # copy into an intermediate bytes object
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
         except Exception:
-            return []
+            return {}
+
+    def _build_pattern_index(self) -> None:
+        """Index patterns by (src_pattern, dst_pattern), first occurrence wins"""
+        self._pattern_index = {}
+        self._by_src_pattern = {}
+        self._src_pattern_lengths = set()
+        for position, p in enumerate(self.patterns):
+            self._pattern_index.setdefault((p["src_pattern"], p.get("dst_pattern")), p)
+            self._index_suggestion_source(position, p)
+
+    def _index_suggestion_source(self, position: int, pattern: Dict) -> None:
+        """Add a local move pattern to the suggest_destination index"""
+        if pattern.get("is_gdrive") or pattern["operation"] != "move":
+            return
+        src_pattern = pattern["src_pattern"]
+        self._by_src_pattern.setdefault(src_pattern, []).append((position, pattern))
+        self._src_pattern_lengths.add(len(src_pattern))
 
     def _save_patterns(self) -> None:
-        """Save patterns to file"""
-        try:
-            with open(self.data_file, "w") as f:
-                json.dump(
-                    {"patterns": self.patterns, "feedback": self.feedback_history},
-                    f,
-                    indent=2,
+        """Mark patterns dirty; the flusher thread writes them out"""
+        self._dirty.set()
+        if self._flusher is None:
+            self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+            self._flusher.start()
+            # Don't lose patterns learned just before the process exits;
+            # close() unregisters this again
+            atexit.register(self.flush)
+
+    def _flush_loop(self) -> None:
+        """Write patterns at most once per FLUSH_INTERVAL while they change"""
+        while not self._closing.is_set():
+            self._dirty.wait()
+            if self._closing.is_set():
+                return
+            # Sleeps out the interval unless close() wakes it early
+            self._closing.wait(self.FLUSH_INTERVAL)
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending pattern and feedback changes to file now"""
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty.is_set():
+                    return
+                self._dirty.clear()
+                payload = _dumps(
+                    {"patterns": self.patterns, "feedback": list(self.feedback_history)}
                 )
-        except Exception:
-            pass
+
+            try:
+                _write_atomic(self.data_file, payload)
+            except Exception as e:
+                # Keep the changes pending so the next flush retries them
+                self._dirty.set()
+                print(f"⚠️  Error saving learned patterns: {e}")
+
+    def close(self) -> None:
+        """Write pending changes and stop the flusher thread"""
+        flusher, self._flusher = self._flusher, None
+        if flusher is not None:
+            atexit.unregister(self.flush)
+            self._closing.set()
+            self._dirty.set()  # wake the flusher if it is idle
+            flusher.join()
+            self._closing.clear()
+        self.flush()
+
+    def _upsert_pattern(self, key: Tuple[str, Optional[str]], pattern: Dict) -> None:
+        """Bump the pattern stored under key, or add pattern as a new one"""
+        with self._lock:
+            existing = self._pattern_index.get(key)
+            if existing is not None:
+                existing["count"] += 1
+                existing["timestamp"] = pattern["timestamp"]
+            else:
+                self.patterns.append(pattern)
+                self._pattern_index[key] = pattern
+                self._index_suggestion_source(len(self.patterns) - 1, pattern)
+
+        self._save_patterns()
 
     def record_operation(self, src: str, dst: Optional[str], operation: str) -> None:
         """
@@ -487,32 +942,23 @@ class FileOperationLearner:
             self._record_gdrive_pattern(src, dst, operation)
             return
 
-        # Local path handling (existing logic)
-        src_path = Path(src)
-        dst_path = Path(dst) if dst else None
+        # Local path handling (existing logic). String ops instead of Path on
+        # the per-event path; "or '.'" keeps Path.parent's result for bare names
+        src_dir, src_name = os.path.split(src)
+        dst_dir, dst_name = os.path.split(dst) if dst else (None, None)
 
         pattern = {
-            "src_pattern": str(src_path.parent),
-            "src_filename": src_path.name,
-            "dst_pattern": str(dst_path.parent) if dst_path else None,
-            "dst_filename": dst_path.name if dst_path else None,
+            "src_pattern": src_dir or ".",
+            "src_filename": src_name,
+            "dst_pattern": (dst_dir or ".") if dst else None,
+            "dst_filename": dst_name,
             "operation": operation,
-            "timestamp": datetime.now().isoformat(),
+            # Epoch seconds; formatting an ISO string per event adds up
+            "timestamp": time.time(),
             "count": 1,
         }
 
-        for existing in self.patterns:
-            if (
-                existing["src_pattern"] == pattern["src_pattern"]
-                and existing["dst_pattern"] == pattern["dst_pattern"]
-            ):
-                existing["count"] += 1
-                existing["timestamp"] = pattern["timestamp"]
-                self._save_patterns()
-                return
-
-        self.patterns.append(pattern)
-        self._save_patterns()
+        self._upsert_pattern((pattern["src_pattern"], pattern["dst_pattern"]), pattern)
 
     def _record_gdrive_pattern(
         self, src: str, dst: Optional[str], operation: str
@@ -520,34 +966,26 @@ class FileOperationLearner:
         """Record a GDrive file operation"""
         is_gdrive = src.startswith("gdrive:")
         src_id = src.replace("gdrive:", "") if is_gdrive else None
-        src_name = Path(src).name if not is_gdrive else "unknown"
+        src_name = os.path.basename(src) if not is_gdrive else "unknown"
 
         pattern = {
             "src_pattern": "gdrive:",
             "src_filename": src_name,
-            "dst_pattern": Path(dst).name
+            "dst_pattern": os.path.basename(dst)
             if dst and not dst.startswith("gdrive:")
             else dst,
             "dst_folder_id": dst.replace("gdrive:", "")
             if dst and dst.startswith("gdrive:")
             else None,
             "operation": operation,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time(),
             "count": 1,
             "is_gdrive": True,
         }
 
-        for existing in self.patterns:
-            if existing.get("is_gdrive") and existing.get("dst_pattern") == pattern.get(
-                "dst_pattern"
-            ):
-                existing["count"] += 1
-                existing["timestamp"] = pattern["timestamp"]
-                self._save_patterns()
-                return
-
-        self.patterns.append(pattern)
-        self._save_patterns()
+        # Every GDrive pattern has src_pattern "gdrive:", so the shared index
+        # doubles as the is_gdrive + dst_pattern lookup
+        self._upsert_pattern(("gdrive:", pattern["dst_pattern"]), pattern)
 
     def get_patterns(self) -> List[Dict]:
         """Get all learned patterns"""
@@ -568,27 +1006,31 @@ class FileOperationLearner:
             return self._suggest_gdrive_destination(file_path)
 
         # Local path handling (existing logic)
-        file_p = Path(file_path)
-        filename = file_p.name
-        src_dir = str(file_p.parent)
-
-        matches = []
-        for p in self.patterns:
-            if p.get("is_gdrive"):
-                continue
-            if p["operation"] == "move" and p["dst_pattern"]:
-                if src_dir == p["src_pattern"] or src_dir.startswith(p["src_pattern"]):
-                    if self._match_pattern(filename, p["src_filename"]):
-                        matches.append(p)
-
-        if not matches:
+        src_dir, filename = os.path.split(file_path)
+        src_dir = src_dir or "."
+
+        # A pattern applies when src_dir starts with its src_pattern, so only
+        # the prefixes of src_dir with the length of some src_pattern can hit
+        best = None
+        best_key = None
+        with self._lock:
+            for length in self._src_pattern_lengths:
+                if length > len(src_dir):
+                    continue
+                for position, p in self._by_src_pattern.get(src_dir[:length], ()):
+                    if p["dst_pattern"] and self._match_pattern(
+                        filename, p["src_filename"]
+                    ):
+                        # Highest count wins; ties go to the earliest learned
+                        key = (-p["count"], position)
+                        if best_key is None or key < best_key:
+                            best, best_key = p, key
+
+        if best is None:
             return None
 
-        matches.sort(key=lambda x: x["count"], reverse=True)
-        best = matches[0]
-
         if "*" in best["dst_pattern"]:
-            dst = best["dst_pattern"].replace("*", file_p.stem)
+            dst = best["dst_pattern"].replace("*", os.path.splitext(filename)[0])
         else:
             dst = os.path.join(best["dst_pattern"], filename)
 
@@ -596,8 +1038,6 @@ class FileOperationLearner:
 
     def _suggest_gdrive_destination(self, file_path: str) -> Optional[str]:
         """Suggest destination for GDrive file"""
-        filename = Path(file_path).name
-
         # Find GDrive patterns
         matches = []
         for p in self.patterns:
@@ -618,9 +1058,7 @@ class FileOperationLearner:
         if pattern == "*" or pattern == filename:
             return True
 
-        # Convert glob to regex
-        regex = pattern.replace(".", "\\.").replace("*", ".*")
-        return bool(re.match(f"^{regex}$", filename))
+        return bool(_glob_to_regex(pattern).match(filename))
 
     def record_feedback(
         self, src_pattern: str, suggested: str, actual: str, accepted: bool
@@ -642,20 +1080,23 @@ class FileOperationLearner:
             "timestamp": datetime.now().isoformat(),
         }
 
-        self.feedback_history.append(feedback)
+        with self._lock:
+            self.feedback_history.append(feedback)
 
-        if not accepted:
-            # Adjust pattern based on feedback
-            for p in self.patterns:
-                if p["src_pattern"] == src_pattern:
-                    p["dst_pattern"] = os.path.dirname(actual)
-                    p["count"] = max(0, p["count"] - 1)
+            if not accepted:
+                # Adjust pattern based on feedback
+                for p in self.patterns:
+                    if p["src_pattern"] == src_pattern:
+                        p["dst_pattern"] = os.path.dirname(actual)
+                        p["count"] = max(0, p["count"] - 1)
+                # dst_pattern is part of the index key
+                self._build_pattern_index()
 
         self._save_patterns()
 
     def get_recent_feedback(self) -> List[Dict]:
         """Get recent feedback entries"""
-        return self.feedback_history[-10:]
+        return list(islice(reversed(self.feedback_history), 10))[::-1]
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get learning statistics"""
@@ -683,7 +1124,7 @@ def create_watch_daemon_with_learning(
     learner = FileOperationLearner()
     generator = FolderStructureGenerator()
 
-    def handle_event(event: FileEvent):
+    def learn(event: FileEvent):
         if event.operation == FileOperation.CREATE:
             # Suggest destination for new file
             suggestion = learner.suggest_destination(event.src_path)
@@ -695,7 +1136,36 @@ def create_watch_daemon_with_learning(
             if event.dest_path:
                 learner.record_operation(event.src_path, event.dest_path, "move")
 
+    # Learner work runs on its own thread so slow suggestions or callbacks
+    # never hold up event dispatch; None on the queue tells it to exit
+    work_queue = queue.SimpleQueue()
+    worker_lock = threading.Lock()
+    workers: List[threading.Thread] = []
+
+    def worker():
+        while (event := work_queue.get()) is not None:
+            try:
+                learn(event)
+            except Exception as e:
+                print(f"⚠️  Error learning from {event.src_path}: {e}")
+
+    def handle_event(event: FileEvent):
+        if event.operation in (FileOperation.CREATE, FileOperation.MOVE):
+            with worker_lock:
+                if not workers:
+                    workers.append(threading.Thread(target=worker, daemon=True))
+                    workers[0].start()
+            work_queue.put(event)
+
+    def stop_worker():
+        with worker_lock:
+            if workers:
+                work_queue.put(None)
+                workers.pop().join()
+        learner.close()
+
     daemon = WatchDaemon(watch_path=watch_path, event_handler=handle_event)
+    daemon.add_stop_hook(stop_worker)
 
     return daemon, learner, generator
 
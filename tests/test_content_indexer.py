@@ -7,6 +7,7 @@ import pytest
 import os
 import tempfile
 import sys
+from unittest.mock import patch
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 from src.content_indexer import ContentIndexer
@@ -164,3 +165,74 @@ def test_index_performance():
 
         assert len(results) >= 99
         assert indexer.get_index_stats()["total_files"] >= 99
+
+
+def test_full_text_search():
+    """Verify stemmed matching and that re-indexing replaces rows"""
+    indexer = ContentIndexer()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with open(os.path.join(tmpdir, "notes.txt"), "w") as f:
+            f.write("Running the indexer on C++ sources")
+
+        indexer.index_directory(tmpdir)
+        indexer.index_directory(tmpdir)
+
+        results = indexer.search("run")
+        assert [r["file"] for r in results] == ["notes.txt"]
+        assert results[0]["content"].startswith("Running")
+        assert len(indexer.search("c++")) == 1
+        assert indexer.get_index_stats()["total_files"] == 1
+
+
+def test_update_index_is_incremental():
+    """Verify update_index only re-reads changed files and drops deleted ones"""
+    indexer = ContentIndexer()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = [os.path.join(tmpdir, name) for name in ("keep.txt", "edit.txt")]
+        for path in paths:
+            with open(path, "w") as f:
+                f.write("original text")
+        indexer.index_directory(tmpdir)
+
+        with patch.object(
+            indexer, "_extract_text_content", side_effect=AssertionError
+        ), patch.object(indexer, "_is_binary_file", side_effect=AssertionError):
+            assert indexer.update_index(tmpdir) == []
+
+        with open(paths[1], "w") as f:
+            f.write("edited text")
+        os.utime(paths[1], ns=(0, 10**9))
+        os.unlink(paths[0])
+
+        results = indexer.update_index(tmpdir)
+
+        assert [r["file"] for r in results] == ["edit.txt"]
+        assert indexer.search("original") == []
+        assert indexer.get_index_stats()["total_files"] == 1
+        assert indexer.get_index_stats()["total_keywords"] == len(
+            indexer.index[paths[1]]["keywords"]
+        )
+
+
+def test_search_cache():
+    """Verify repeated searches are cached and invalidated on index changes"""
+    indexer = ContentIndexer()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with open(os.path.join(tmpdir, "a.txt"), "w") as f:
+            f.write("Python notes")
+        indexer.index_directory(tmpdir)
+
+        first = indexer.search("python")
+        first[0]["keywords"].append("mutated")
+        assert "mutated" not in indexer.search("python")[0]["keywords"]
+        assert len(indexer._query_cache) == 1
+
+        with open(os.path.join(tmpdir, "b.txt"), "w") as f:
+            f.write("More python")
+        indexer.update_index(tmpdir)
+
+        assert len(indexer._query_cache) == 0
+        assert len(indexer.search("python")) == 2
@@ -146,3 +146,37 @@ def test_duplicate_grouping():
         # Each duplicate group should have at least 2 files
         for file_hash, files in results["duplicates"].items():
             assert len(files) >= 2
+
+
+def test_unique_sizes_are_not_hashed(monkeypatch):
+    """Verify only files sharing a size are hashed, and tiers agree"""
+    import src.duplicate_detector as dd
+
+    detector = DuplicateDetector()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = {}
+        for name, content in [
+            ("a_1.txt", "same content\n" * 50),
+            ("a_2.txt", "same content\n" * 50),
+            ("b_1.txt", "SAME CONTENT\n" * 50),
+            ("unique.txt", "different length\n" * 70),
+        ]:
+            paths[name] = os.path.join(tmpdir, name)
+            with open(paths[name], "w") as f:
+                f.write(content)
+
+        hashed = []
+        original = dd._hash_file
+
+        def tracking_hash_file(file_path, hasher):
+            hashed.append(file_path)
+            return original(file_path, hasher)
+
+        monkeypatch.setattr(dd, "_hash_file", tracking_hash_file)
+        results = detector.tiered_scan(files=list(paths.values()))
+
+        assert paths["unique.txt"] not in hashed
+        expected = [paths["a_1.txt"], paths["a_2.txt"]]
+        assert list(results["potential_duplicates"].values()) == [expected]
+        assert list(results["verified_duplicates"].values()) == [expected]
@@ -7,6 +7,7 @@ import pytest
 import os
 import tempfile
 import sys
+from unittest.mock import MagicMock, patch
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 from src.google_drive_api import GoogleDriveAPI
@@ -118,3 +119,86 @@ def test_batch_operations():
     results = api.batch_delete(file_ids)
 
     assert results is None or isinstance(results, list)
+
+
+def test_batch_delete_uses_batch_requests():
+    """Verify deletes are chunked into batches and results map back by index"""
+    api = GoogleDriveAPI()
+    api.service = MagicMock()
+    api.authenticated = True
+
+    file_ids = [f"id{i}" for i in range(150)]
+    batches = []
+
+    def new_batch(callback):
+        batch = MagicMock()
+        requests = []
+        batch.add.side_effect = lambda request, request_id: requests.append(
+            request_id
+        )
+
+        def execute():
+            if len(batches) == 2:
+                raise ConnectionError("batch lost")
+            for request_id in requests:
+                error = Exception("404") if request_id == "7" else None
+                callback(request_id, None, error)
+
+        batch.execute.side_effect = execute
+        batches.append(requests)
+        return batch
+
+    api.service.new_batch_http_request.side_effect = new_batch
+
+    results = api.batch_delete(file_ids)
+
+    assert [len(requests) for requests in batches] == [100, 50]
+    assert batches[1][0] == "100"
+    assert results[:7] == [True] * 7
+    assert results[7] is False
+    assert results[8:100] == [True] * 92
+    assert results[100:] == [False] * 50
+
+
+def test_upload_file_streams_resumable_chunks():
+    """Verify uploads loop over next_chunk and report progress per chunk"""
+    import types
+
+    api = GoogleDriveAPI()
+    api.service = MagicMock()
+    api.authenticated = True
+
+    chunk = GoogleDriveAPI.UPLOAD_CHUNK_SIZE
+    request = api.service.files.return_value.create.return_value
+    request.next_chunk.side_effect = [
+        (MagicMock(resumable_progress=chunk, total_size=3 * chunk), None),
+        (MagicMock(resumable_progress=2 * chunk, total_size=3 * chunk), None),
+        (None, {"id": "file123"}),
+    ]
+
+    media_upload = MagicMock()
+    media_upload.return_value.size.return_value = 3 * chunk
+    http_module = types.ModuleType("googleapiclient.http")
+    http_module.MediaFileUpload = media_upload
+
+    progress = []
+    with patch.dict(
+        sys.modules,
+        {
+            "googleapiclient": types.ModuleType("googleapiclient"),
+            "googleapiclient.http": http_module,
+        },
+    ):
+        file_id = api.upload_file(
+            "/tmp/big.bin", progress_callback=lambda *p: progress.append(p)
+        )
+
+    assert file_id == "file123"
+    assert media_upload.call_args.kwargs["resumable"] is True
+    assert media_upload.call_args.kwargs["chunksize"] == chunk
+    assert request.next_chunk.call_count == 3
+    assert progress == [
+        (chunk, 3 * chunk),
+        (2 * chunk, 3 * chunk),
+        (3 * chunk, 3 * chunk),
+    ]
@@ -37,6 +37,19 @@ def test_discover_naming_patterns():
         assert any("invoice" in p.get("pattern", "") for p in result)
 
 
+def test_discover_naming_patterns_unicode_digits():
+    """Verify numbered patterns are found with non-ASCII digits"""
+    discovery = PatternDiscovery()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name in ["請求書_００１.pdf", "請求書_００２.pdf"]:
+            open(os.path.join(tmpdir, name), "w").close()
+
+        result = discovery.discover_naming_patterns(tmpdir)
+
+        assert any(p.get("pattern") == "請求書_###.pdf" for p in result)
+
+
 def test_discover_organization_patterns():
     """Verify discovering organization patterns"""
     discovery = PatternDiscovery()
@@ -202,3 +215,91 @@ def test_pattern_confidence():
         # Should have high confidence for clear patterns
         if patterns:
             assert any(p.get("confidence", 0) > 0.5 for p in patterns)
+
+
+def test_size_pattern_categories():
+    """Verify size buckets and statistics"""
+    discovery = PatternDiscovery()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        sizes = {"tiny.bin": 1023, "small.bin": 1024, "medium.bin": 100 * 1024}
+
+        for filename, size in sizes.items():
+            with open(os.path.join(tmpdir, filename), "wb") as f:
+                f.write(b"x" * size)
+
+        result = discovery.discover_size_patterns(tmpdir)
+        categories = {d["file"]: d["category"] for d in result["size_distribution"]}
+
+        assert categories["tiny.bin"] == "tiny (< 1KB)"
+        assert categories["small.bin"] == "small (1-100KB)"
+        assert categories["medium.bin"] == "medium (100KB-1MB)"
+        assert result["statistics"]["min_size"] == 1023
+        assert result["statistics"]["total_size"] == sum(sizes.values())
+
+
+def test_size_patterns_follow_symlinks():
+    """Verify a symlinked file is sized by its target"""
+    discovery = PatternDiscovery()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        target = os.path.join(tmpdir, "big.bin")
+        with open(target, "wb") as f:
+            f.write(b"x" * 200 * 1024)
+        watched = os.path.join(tmpdir, "watched")
+        os.mkdir(watched)
+        os.symlink(target, os.path.join(watched, "link.bin"))
+
+        result = discovery.discover_size_patterns(watched)
+        categories = {d["file"]: d["category"] for d in result["size_distribution"]}
+
+        assert categories["link.bin"] == "medium (100KB-1MB)"
+        assert result["statistics"]["total_size"] == 200 * 1024
+
+
+def test_discover_all_missing_directory():
+    """Verify discover_all returns empty results for a missing directory"""
+    discovery = PatternDiscovery()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        result = discovery.discover_all(os.path.join(tmpdir, "missing"))
+
+        assert result["naming_patterns"] == []
+        assert result["temp_files"]["count"] == 0
+        assert result["recommendations"] == []
+
+
+def test_discover_all_cache_invalidation():
+    """Verify discover_all is cached until an entry changes"""
+    discovery = PatternDiscovery()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "file.tmp")
+        with open(path, "w") as f:
+            f.write("old")
+
+        first = discovery.discover_all(tmpdir)
+        again = discovery.discover_all(tmpdir)
+        assert again is not first
+        again.pop("analyzed_at")
+        assert again == {k: v for k, v in first.items() if k != "analyzed_at"}
+        assert len(discovery._discover_cache) == 1
+
+        # Mutating a returned result must not leak into later calls
+        first["temp_files"]["temp_files"].clear()
+        assert discovery.discover_all(tmpdir)["temp_files"]["count"] == 1
+
+        # Rewriting contents leaves the directory mtime alone but is a miss
+        dir_mtime = os.stat(tmpdir).st_mtime_ns
+        with open(path, "w") as f:
+            f.write("much longer contents")
+        os.utime(tmpdir, ns=(dir_mtime, dir_mtime))
+
+        rewritten = discovery.discover_all(tmpdir)
+        assert len(discovery._discover_cache) == 2
+        assert rewritten["size_patterns"]["statistics"]["total_size"] == 20
+
+        open(os.path.join(tmpdir, "other.tmp"), "w").close()
+
+        second = discovery.discover_all(tmpdir)
+        assert second["temp_files"]["count"] == 2
@@ -176,3 +176,15 @@ def test_concurrent_operations():
     stats = monitor.get_operation_stats("concurrent")
 
     assert stats["count"] == 2
+
+
+def test_timing_samples_bounded():
+    """Verify per-operation timing samples are capped at max_samples"""
+    monitor = PerformanceMonitor(max_samples=5)
+
+    for _ in range(10):
+        with monitor.track_operation("bounded"):
+            pass
+
+    assert monitor.get_operation_stats("bounded")["count"] == 10
+    assert len(monitor.generate_report()["operations"]["bounded"]["times"]) == 5
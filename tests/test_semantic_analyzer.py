@@ -7,6 +7,7 @@ import pytest
 import os
 import tempfile
 import sys
+from unittest.mock import patch
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 from src.semantic_analyzer import SemanticAnalyzer
@@ -111,6 +112,17 @@ def test_action_classification():
     assert action3 == "KEEP_ACTIVE"
 
 
+def test_classification_boundaries():
+    """Verify table-based classification keeps the threshold boundaries"""
+    analyzer = SemanticAnalyzer()
+
+    assert analyzer.classify_risk(0.5) == "HIGH"
+    assert analyzer.classify_risk(0.85) == "LOW"
+    assert analyzer.classify_action(risk="LOW", confidence=0.85) == "KEEP_ACTIVE"
+    assert analyzer.classify_action(risk="MEDIUM", confidence=0.5) == "KEEP_ACTIVE"
+    assert analyzer.classify_action(risk="UNKNOWN", confidence=0.3) == "REVIEW_MANUAL"
+
+
 def test_overall_confidence():
     """Verify overall confidence calculation from weighted dimensions"""
     analyzer = SemanticAnalyzer()
@@ -148,6 +160,26 @@ def test_learning_system():
     assert "learned_patterns" in dir(analyzer)
 
 
+def test_learned_patterns_persistence():
+    """Verify corrections are appended to the log and reloaded"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        patterns_file = os.path.join(tmpdir, "learned_patterns.bin")
+
+        analyzer = SemanticAnalyzer(patterns_file=patterns_file)
+        for i in range(3):
+            analyzer.learn_from_correction("txt", "archived", confidence=0.1 * i)
+        analyzer.learn_from_correction("pdf", "documents", confidence=0.9)
+
+        # One fixed-size record per correction
+        assert os.path.getsize(patterns_file) == 4 * 24
+        analyzer.close()
+        assert analyzer._patterns_log is None
+
+        reloaded = SemanticAnalyzer(patterns_file=patterns_file)
+        assert reloaded.learned_patterns == analyzer.learned_patterns
+        assert len(reloaded.learned_patterns["txt:archived"]) == 3
+
+
 def test_batch_processing():
     """Verify batch processing handles multiple files efficiently"""
     analyzer = SemanticAnalyzer()
@@ -185,3 +217,94 @@ def test_statistics_generation():
     assert "average_confidence" in stats
     assert "risk_distribution" in stats
     assert "action_distribution" in stats
+
+
+def test_vectorized_scores_match_scalar():
+    """Verify vectorized age/size scores agree with the scalar versions"""
+    analyzer = SemanticAnalyzer()
+
+    sizes = [0, 1024 * 1024, 20 * 1024 * 1024, 75 * 1024 * 1024, 200 * 1024 * 1024]
+    assert list(analyzer.calculate_size_scores(sizes)) == [
+        analyzer.calculate_size_score(size) for size in sizes
+    ]
+
+    ages = [0, 7, 8, 45, 120, 400]
+    assert list(analyzer.calculate_age_scores(ages)) == [0.1, 0.1, 0.3, 0.5, 0.7, 0.9]
+
+
+def test_analysis_cache():
+    """Verify unchanged files are served from the persisted analysis cache"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        file_path = os.path.join(tmpdir, "notes.txt")
+        with open(file_path, "w") as f:
+            f.write("content")
+
+        cache_file = os.path.join(tmpdir, "analyzer_cache.json")
+        analyzer = SemanticAnalyzer(cache_file=cache_file)
+        first = analyzer.analyze_file(file_path)
+        analyzer.save_cache()
+
+        reloaded = SemanticAnalyzer(cache_file=cache_file)
+        assert len(reloaded._cache) == 1
+
+        # A hit never reaches the scorers
+        with patch.object(
+            reloaded, "calculate_type_score", side_effect=AssertionError
+        ), patch.object(
+            reloaded, "calculate_location_score", side_effect=AssertionError
+        ), patch.object(
+            reloaded, "calculate_overall_confidence", side_effect=AssertionError
+        ):
+            second = reloaded.analyze_file(file_path)
+            assert second["confidence"] == first["confidence"]
+            assert reloaded.generate_statistics()["total_files_analyzed"] == 1
+
+            # Results don't share the nested scores dict with the cache
+            second["scores"]["type_score"] = -1.0
+            third = reloaded.analyze_file(file_path)
+            assert third["scores"]["type_score"] == first["scores"]["type_score"]
+
+
+def test_batch_analyze_directory():
+    """Verify directory batch analysis walks the whole tree"""
+    analyzer = SemanticAnalyzer()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.makedirs(os.path.join(tmpdir, "nested"))
+        for name in ["a.txt", os.path.join("nested", "b.pdf")]:
+            with open(os.path.join(tmpdir, name), "w") as f:
+                f.write("data")
+
+        results = analyzer.batch_analyze_directory(tmpdir)
+
+        assert len(results) == 2
+        assert {os.path.basename(r["file_path"]) for r in results} == {"a.txt", "b.pdf"}
+        assert analyzer.generate_statistics()["total_files_analyzed"] == 2
+
+
+def test_ext_of():
+    """Verify extension extraction follows os.path.splitext"""
+    from src.semantic_analyzer import ext_of
+
+    assert ext_of("docs/Report.PDF") == ".pdf"
+    assert ext_of("archive.tar.gz") == ".gz"
+    assert ext_of("home/.bashrc") == ""
+    assert ext_of("release.v2/README") == ""
+
+
+def test_analysis_stats_distributions():
+    """Verify analysis_stats still exposes name-keyed distributions"""
+    analyzer = SemanticAnalyzer()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        file_path = os.path.join(tmpdir, "notes.txt")
+        with open(file_path, "w") as f:
+            f.write("content")
+
+        result = analyzer.analyze_file(file_path)
+
+    stats = analyzer.analysis_stats
+    assert stats["total_files_analyzed"] == 1
+    assert stats["risk_distribution"][result["risk"]] == 1
+    assert stats["action_distribution"][result["action"]] == 1
+    assert sum(stats["risk_distribution"].values()) == 1
@@ -0,0 +1,69 @@
+# tests/test_smart_folder_namer.py
+"""
+Tests for the smart folder namer's offline fallbacks
+"""
+
+import pytest
+import os
+import sys
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from src.smart_folder_namer import SmartFolderNamer
+
+
+def test_fallback_structure_groups_by_extension():
+    """Verify files are grouped into type folders by extension"""
+    namer = SmartFolderNamer()
+    files = [
+        "/inbox/Report.PDF",
+        "/inbox/photo.jpg",
+        "/inbox/notes.md",
+        "/inbox/archive.tar.gz",
+        "/inbox/.bashrc",
+        "/inbox/v1.2/README",
+    ]
+
+    with patch.object(namer, "_is_connected", return_value=False):
+        structure = namer.suggest_structure(files)
+
+    assert structure == [
+        {"folder_name": "Documents", "files": ["Report.PDF"]},
+        {"folder_name": "Images", "files": ["photo.jpg"]},
+        {"folder_name": "Notes", "files": ["notes.md"]},
+        {"folder_name": "GZ", "files": ["archive.tar.gz"]},
+        {"folder_name": "OTHER", "files": [".bashrc", "README"]},
+    ]
+
+
+def test_fallback_structure_limits_folders():
+    """Verify no more than max_folders folders are suggested"""
+    namer = SmartFolderNamer()
+    files = [f"/inbox/file.{ext}" for ext in ("pdf", "jpg", "mp4", "zip", "txt")]
+
+    with patch.object(namer, "_is_connected", return_value=False):
+        structure = namer.suggest_structure(files, max_folders=2)
+
+    assert [folder["folder_name"] for folder in structure] == ["Documents", "Images"]
+
+
+def test_fallback_suggestion_uses_most_frequent_type():
+    """Verify the most common known type names the folder, not the first"""
+    namer = SmartFolderNamer()
+    files = ["/inbox/cover.png"] + [f"/inbox/scan_{i:03d}.pdf" for i in range(100)]
+
+    with patch.object(namer, "_is_connected", return_value=False):
+        result = namer.suggest_folder_name(files)
+
+    assert result["suggested"] == "Documents"
+    assert result["confidence"] == "low"
+
+
+def test_fallback_suggestion_without_known_types():
+    """Verify unknown extensions fall back to Mixed"""
+    namer = SmartFolderNamer()
+
+    with patch.object(namer, "_is_connected", return_value=False):
+        result = namer.suggest_folder_name(["/inbox/data.bin", "/inbox/Makefile"])
+
+    assert result["suggested"] == "Mixed"
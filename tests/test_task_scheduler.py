@@ -0,0 +1,47 @@
+# tests/test_task_scheduler.py
+"""
+Tests for the task scheduler's debounced schedule persistence
+"""
+
+import pytest
+import os
+import tempfile
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from src.task_scheduler import TaskScheduler
+
+
+def test_flush_persists_jobs():
+    """Verify a flushed job is seen by a new scheduler on the same data_dir"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        scheduler = TaskScheduler(data_dir=tmpdir)
+        scheduler.add_job("organize", "organize ~/Downloads", "every 1h")
+        scheduler.flush_schedule()
+
+        reloaded = TaskScheduler(data_dir=tmpdir)
+        assert reloaded.jobs["organize"]["command"] == "organize ~/Downloads"
+
+        scheduler.close()
+        assert scheduler._flusher is None
+
+
+def test_failed_flush_keeps_changes_pending(monkeypatch):
+    """Verify a failed write is retried instead of dropped"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        scheduler = TaskScheduler(data_dir=tmpdir)
+        scheduler.add_job("organize", "organize ~/Downloads", "every 1h")
+
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", failing_replace)
+        with pytest.raises(OSError):
+            scheduler.flush_schedule()
+        monkeypatch.undo()
+
+        assert scheduler._dirty.is_set()
+        assert not os.path.exists(scheduler.schedule_file + ".tmp")
+
+        scheduler.close()
+        assert TaskScheduler(data_dir=tmpdir).jobs.keys() == {"organize"}
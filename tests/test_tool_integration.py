@@ -76,6 +76,21 @@ def test_tool_availability_check():
         assert isinstance(available, bool)
 
 
+def test_tool_availability_cached():
+    """Verify availability lookups are memoized and can be reset"""
+    from src.tool_integration import _which, reset_tool_cache
+
+    integration = ToolIntegration()
+    reset_tool_cache()
+
+    assert not integration.check_tool_available("nonexistent_tool")
+    assert not integration.check_tool_available("nonexistent_tool")
+    assert _which.cache_info().hits == 1
+
+    reset_tool_cache()
+    assert _which.cache_info().currsize == 0
+
+
 def test_fd_with_extensions():
     """Verify fd search with file extension filtering"""
     integration = ToolIntegration()
@@ -148,3 +163,18 @@ def test_tool_timeout():
 
     # Should handle timeout gracefully
     assert results is not None
+
+
+def test_execute_tool_timeout_kills_child_processes():
+    """Verify the timeout also stops children forked by the tool"""
+    import time
+
+    integration = ToolIntegration()
+
+    start = time.monotonic()
+    results = integration.execute_tool("sh", ["-c", "sleep 3; echo done"], timeout=1)
+    elapsed = time.monotonic() - start
+
+    assert results is None
+    assert elapsed < 2
+    assert integration.get_execution_stats()["failed_executions"] == 1
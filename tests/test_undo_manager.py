@@ -0,0 +1,177 @@
+# tests/test_undo_manager.py
+"""
+Tests for the undo manager: undo results and the on-disk logs
+"""
+
+import pytest
+import os
+import tempfile
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from src.undo_manager import UndoManager
+
+
+def test_undo_mixed_batch_is_partial():
+    """Verify a batch with successes and failures reports partial status"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = UndoManager(data_dir=os.path.join(tmpdir, "data"))
+
+        source = os.path.join(tmpdir, "report.pdf")
+        destination = os.path.join(tmpdir, "work_report.pdf")
+        with open(destination, "w") as f:
+            f.write("report")
+        moved = manager.record_action("move", source, destination)
+        missing = manager.record_action("copy", source, destination + ".gone")
+
+        result = manager.undo(batch=[moved, missing, 99])
+
+        assert result["success"] is False
+        assert result["status"] == "partial"
+        assert result["undone_count"] == 1
+        assert [f["id"] for f in result["failed"]] == [missing, 99]
+        assert os.path.exists(source)
+        assert manager.undo(batch=[missing])["status"] == "failed"
+
+
+def test_undo_restores_deleted_file_from_backup():
+    """Verify a delete is undone from backups/action_<id>_<name>"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_dir = os.path.join(tmpdir, "data")
+        manager = UndoManager(data_dir=data_dir)
+
+        source = os.path.join(tmpdir, "notes.txt")
+        action_id = manager.record_action("delete", source, "")
+
+        os.makedirs(os.path.join(data_dir, "backups"))
+        backup = os.path.join(data_dir, "backups", f"action_{action_id}_notes.txt")
+        with open(backup, "w") as f:
+            f.write("saved notes")
+
+        result = manager.undo(action_id=action_id)
+
+        assert result["success"] is True
+        assert result["status"] == "ok"
+        with open(source) as f:
+            assert f.read() == "saved notes"
+
+
+def test_undo_twice_reports_already_undone():
+    """Verify a second undo of the same action is rejected"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = UndoManager(data_dir=os.path.join(tmpdir, "data"))
+
+        destination = os.path.join(tmpdir, "copy.txt")
+        with open(destination, "w") as f:
+            f.write("copy")
+        action_id = manager.record_action("copy", "orig.txt", destination)
+
+        assert manager.undo(action_id=action_id)["status"] == "ok"
+
+        again = manager.undo(action_id=action_id)
+        assert again["status"] == "failed"
+        assert again["failed"] == [{"id": action_id, "error": "Already undone"}]
+
+
+def test_statuses_reload_from_status_log():
+    """Verify undo statuses appended to undo_status.jsonl survive a restart"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_dir = os.path.join(tmpdir, "data")
+        manager = UndoManager(data_dir=data_dir)
+
+        destination = os.path.join(tmpdir, "copy.txt")
+        with open(destination, "w") as f:
+            f.write("copy")
+        undone = manager.record_action("copy", "orig.txt", destination)
+        kept = manager.record_action("move", "a.txt", "b.txt")
+        manager.undo(action_id=undone)
+        manager._close_logs()
+
+        assert os.path.exists(os.path.join(data_dir, "undo_status.jsonl"))
+
+        reloaded = UndoManager(data_dir=data_dir)
+        assert reloaded.get_action(undone)["status"] == "undone"
+        assert "undone_at" in reloaded.get_action(undone)
+        assert reloaded.get_action(kept)["status"] == "executed"
+
+
+def test_torn_trailing_line_is_skipped():
+    """Verify a partially written last record does not break loading"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_dir = os.path.join(tmpdir, "data")
+        manager = UndoManager(data_dir=data_dir)
+        manager.record_action("move", "a.txt", "b.txt")
+        manager.record_action("move", "c.txt", "d.txt")
+        manager._close_logs()
+
+        with open(os.path.join(data_dir, "undo_history.jsonl"), "ab") as f:
+            f.write(b'{"id": 2, "type": "mo')
+
+        reloaded = UndoManager(data_dir=data_dir)
+        assert [a["id"] for a in reloaded.history] == [0, 1]
+        assert reloaded.record_action("move", "e.txt", "f.txt") == 2
+        reloaded._close_logs()
+
+        again = UndoManager(data_dir=data_dir)
+        assert [a["id"] for a in again.history] == [0, 1, 2]
+        assert again.get_action(2)["source"] == "e.txt"
+
+
+def test_legacy_json_history_is_migrated():
+    """Verify undo_history.json is converted to the JSON-lines log"""
+    import json
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_dir = os.path.join(tmpdir, "data")
+        os.makedirs(data_dir)
+        legacy = [
+            {
+                "id": i,
+                "type": "move",
+                "source": f"a{i}",
+                "destination": f"b{i}",
+                "timestamp": f"2024-01-0{i + 1}T00:00:00",
+                "status": status,
+            }
+            for i, status in enumerate(["undone", "executed"])
+        ]
+        with open(os.path.join(data_dir, "undo_history.json"), "w") as f:
+            json.dump({"actions": legacy}, f)
+
+        manager = UndoManager(data_dir=data_dir)
+        assert manager.history == legacy
+        assert os.path.exists(os.path.join(data_dir, "undo_history.jsonl"))
+
+        reloaded = UndoManager(data_dir=data_dir)
+        assert reloaded.history == legacy
+        assert reloaded.get_statistics()["undone_count"] == 1
+
+
+def test_clear_history_compacts_logs():
+    """Verify clear_history rewrites the log and drops the status log"""
+    from datetime import datetime, timedelta
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_dir = os.path.join(tmpdir, "data")
+        manager = UndoManager(data_dir=data_dir)
+
+        destination = os.path.join(tmpdir, "copy.txt")
+        with open(destination, "w") as f:
+            f.write("copy")
+        action_id = manager.record_action("copy", "orig.txt", destination)
+        manager.undo(action_id=action_id)
+
+        assert manager.clear_history(before=datetime.now() - timedelta(days=1)) == 0
+        assert not os.path.exists(os.path.join(data_dir, "undo_status.jsonl"))
+
+        reloaded = UndoManager(data_dir=data_dir)
+        assert reloaded.get_action(action_id)["status"] == "undone"
+
+        assert reloaded.clear_history() == 1
+        assert reloaded.record_action("move", "a.txt", "b.txt") == action_id + 1
+        reloaded._close_logs()
+
+        cleared = UndoManager(data_dir=data_dir)
+        assert cleared.clear_history() == 1
+        assert UndoManager(data_dir=data_dir).history == []
+        assert cleared.record_action("move", "c.txt", "d.txt") == action_id + 2
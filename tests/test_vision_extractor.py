@@ -36,6 +36,25 @@ def test_vision_detects_images():
         assert any("image.png" in img for img in images)
 
 
+def test_vision_find_images_recursive():
+    """Verify image search descends into subfolders but skips tool dirs"""
+    from src.vision_extractor import VisionExtractor
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        (Path(tmpdir) / "albums" / "2024").mkdir(parents=True)
+        (Path(tmpdir) / "albums" / "2024" / "beach.JPG").write_bytes(b"fake")
+        (Path(tmpdir) / "node_modules").mkdir()
+        (Path(tmpdir) / "node_modules" / "icon.png").write_bytes(b"fake")
+
+        extractor = VisionExtractor()
+
+        images = extractor.find_images(tmpdir)
+        assert len(images) == 1
+        assert images[0].endswith("beach.JPG")
+
+        assert extractor.find_images(tmpdir, recursive=False) == []
+
+
 def test_vision_basic_analysis():
     """Verify extractor does basic analysis without vision model"""
     from src.vision_extractor import VisionExtractor
@@ -107,5 +126,95 @@ def test_vision_extracts_image_metadata():
         assert "height" in metadata
 
 
+def test_vision_extracts_metadata_batch():
+    """Verify batch metadata extraction keeps input order"""
+    from src.vision_extractor import VisionExtractor
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = []
+        for i in range(5):
+            path = Path(tmpdir) / f"photo_{i}.png"
+            path.write_bytes(b"x" * (i + 1))
+            paths.append(str(path))
+
+        extractor = VisionExtractor()
+        results = extractor.extract_image_metadata_batch(paths, workers=3)
+
+        assert [r["file_path"] for r in results] == paths
+        assert [r["file_size"] for r in results] == [1, 2, 3, 4, 5]
+
+
+def test_vision_analysis_cache():
+    """Verify cached analyses are keyed by image content and reloaded"""
+    from src.vision_extractor import VisionExtractor
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        image = Path(tmpdir) / "photo.jpg"
+        image.write_bytes(b"fake jpg content")
+        copy = Path(tmpdir) / "renamed.jpg"
+        copy.write_bytes(b"fake jpg content")
+        cache_file = os.path.join(tmpdir, "vision_cache.jsonl")
+
+        extractor = VisionExtractor(cache_file=cache_file)
+        key = extractor._content_key(str(image))
+        assert key == extractor._content_key(str(copy))
+        extractor._remember(key, {"category": "nature", "confidence": 0.9})
+
+        reloaded = VisionExtractor(cache_file=cache_file)
+        analysis = reloaded.analyze_image(str(copy))
+
+        assert analysis["category"] == "nature"
+        assert analysis["confidence"] == 0.9
+
+
+def test_vision_reads_dimensions_from_header():
+    """Verify PNG and GIF dimensions are parsed without Pillow"""
+    import struct
+    from src.vision_extractor import VisionExtractor
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        png = Path(tmpdir) / "chart.png"
+        png.write_bytes(
+            b"\x89PNG\r\n\x1a\n"
+            + b"\x00\x00\x00\x0dIHDR"
+            + struct.pack(">II", 640, 480)
+        )
+        gif = Path(tmpdir) / "loop.gif"
+        gif.write_bytes(b"GIF89a" + struct.pack("<HH", 32, 16) + b"\x00" * 6)
+
+        extractor = VisionExtractor()
+        png_meta = extractor.extract_image_metadata(str(png))
+        gif_meta = extractor.extract_image_metadata(str(gif))
+
+        assert (png_meta["width"], png_meta["height"]) == (640, 480)
+        assert (gif_meta["width"], gif_meta["height"]) == (32, 16)
+
+
+
+@pytest.mark.parametrize(
+    "name, save_kwargs",
+    [
+        ("baseline.jpg", {"format": "JPEG"}),
+        ("progressive.jpg", {"format": "JPEG", "progressive": True}),
+        ("exif.jpg", {"format": "JPEG", "exif": b"Exif\x00\x00" + b"\x00" * 64}),
+        ("lossy.webp", {"format": "WEBP", "quality": 80}),
+        ("lossless.webp", {"format": "WEBP", "lossless": True}),
+        ("extended.webp", {"format": "WEBP", "icc_profile": b"\x00" * 128}),
+    ],
+)
+def test_fast_dims_matches_pillow(name, save_kwargs):
+    """Verify JPEG SOF walking and WEBP VP8/VP8L/VP8X parsing agree with Pillow"""
+    Image = pytest.importorskip("PIL.Image")
+    from src.vision_extractor import _fast_dims
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, name)
+        Image.new("RGB", (321, 123), (200, 40, 90)).save(path, **save_kwargs)
+
+        with Image.open(path) as img:
+            expected = img.size
+
+        assert _fast_dims(path) == expected
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
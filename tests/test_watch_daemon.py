@@ -94,6 +94,123 @@ def test_watch_daemon_detects_moves():
             daemon.stop()
 
 
+def test_watch_daemon_calls_handler_once_per_event():
+    """Verify each event reaches the handler exactly once"""
+    from src.watch_daemon import WatchDaemon, FileOperation
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        event_handler = Mock()
+
+        daemon = WatchDaemon(watch_path=tmpdir, event_handler=event_handler)
+
+        with patch.object(daemon, "_start_observer") as mock_start:
+            mock_start.return_value = None
+            daemon.start(blocking=False)
+
+            old_path = os.path.join(tmpdir, "old.txt")
+            new_path = os.path.join(tmpdir, "new.txt")
+            daemon._on_event(FileOperation.MOVE, old_path, new_path)
+
+            time.sleep(0.1)
+            daemon.stop()
+
+        assert event_handler.call_count == 1
+
+
+def test_watch_daemon_coalesces_modify_events():
+    """Verify MODIFY events right after a CREATE are folded into it"""
+    from src.watch_daemon import WatchDaemon, FileOperation
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        event_handler = Mock()
+
+        daemon = WatchDaemon(watch_path=tmpdir, event_handler=event_handler)
+
+        with patch.object(daemon, "_start_observer") as mock_start:
+            mock_start.return_value = None
+            daemon.start(blocking=False)
+
+            test_file = os.path.join(tmpdir, "new_file.txt")
+            daemon._on_event(FileOperation.CREATE, test_file)
+            daemon._on_event(FileOperation.MODIFY, test_file)
+            daemon._on_event(FileOperation.MODIFY, test_file)
+            daemon._on_event(FileOperation.DELETE, test_file)
+
+            time.sleep(0.1)
+            daemon.stop()
+
+        operations = [c.args[0].operation for c in event_handler.call_args_list]
+        assert operations == [FileOperation.CREATE, FileOperation.DELETE]
+
+
+def test_watch_daemon_reports_overflow_as_rescan():
+    """Verify dropped events are replaced by one directory rescan event"""
+    from src.watch_daemon import WatchDaemon, FileOperation
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        event_handler = Mock()
+
+        daemon = WatchDaemon(
+            watch_path=tmpdir, event_handler=event_handler, max_queue_size=2
+        )
+
+        # Fill the queue before the processing thread starts draining it
+        for i in range(5):
+            daemon._on_event(FileOperation.CREATE, os.path.join(tmpdir, f"{i}.txt"))
+
+        with patch.object(daemon, "_start_observer") as mock_start:
+            mock_start.return_value = None
+            daemon.start(blocking=False)
+            time.sleep(0.1)
+            daemon.stop()
+
+        events = [c.args[0] for c in event_handler.call_args_list]
+        assert len(events) == 3
+        assert events[-1].is_directory
+        assert events[-1].src_path == tmpdir
+
+
+def test_watch_daemon_unbounded_queue():
+    """Verify an unbounded daemon delivers every event"""
+    from src.watch_daemon import WatchDaemon, FileOperation
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        event_handler = Mock()
+
+        daemon = WatchDaemon(
+            watch_path=tmpdir, event_handler=event_handler, max_queue_size=None
+        )
+
+        for i in range(50):
+            daemon._on_event(FileOperation.CREATE, os.path.join(tmpdir, f"{i}.txt"))
+
+        with patch.object(daemon, "_start_observer") as mock_start:
+            mock_start.return_value = None
+            daemon.start(blocking=False)
+            time.sleep(0.1)
+            daemon.stop()
+
+        assert event_handler.call_count == 50
+
+
+def test_watch_daemon_filters_by_patterns():
+    """Verify include/ignore patterns are applied to filenames"""
+    from src.watch_daemon import WatchDaemon
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        daemon = WatchDaemon(
+            watch_path=tmpdir,
+            patterns=["*.pdf", "*.txt"],
+            ignore_patterns=["~$*", ".*"],
+        )
+
+        assert daemon._should_include("report.pdf")
+        assert daemon._should_include("NOTES.TXT")
+        assert not daemon._should_include("photo.jpg")
+        assert not daemon._should_include("~$report.pdf")
+        assert not daemon._should_include(".hidden.txt")
+
+
 def test_folder_generator_initialization():
     """Verify folder structure generator can be initialized"""
     from src.watch_daemon import FolderStructureGenerator
@@ -177,6 +294,7 @@ def test_learning_system_records_patterns():
         patterns = learner.get_patterns()
 
         assert len(patterns) >= 1
+        learner.close()
 
 
 def test_learning_system_suggests_action():
@@ -201,6 +319,7 @@ def test_learning_system_suggests_action():
 
         # Should suggest based on src_pattern matching
         assert suggestion is not None or len(learner.get_patterns()) >= 1
+        learner.close()
 
 
 def test_learning_system_learns_from_decisions():
@@ -230,6 +349,138 @@ def test_learning_system_learns_from_decisions():
         # Check that feedback was recorded
         feedback = learner.get_recent_feedback()
         assert len(feedback) >= 1
+        learner.close()
+
+
+def test_learning_system_flushes_patterns():
+    """Verify debounced pattern writes reach disk on flush"""
+    from src.watch_daemon import FileOperationLearner
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_file = os.path.join(tmpdir, "test_learning.json")
+        learner = FileOperationLearner(data_file=data_file)
+
+        for _ in range(3):
+            learner.record_operation(
+                src=os.path.join(tmpdir, "downloads", "report.pdf"),
+                dst=os.path.join(tmpdir, "work", "report.pdf"),
+                operation="move",
+            )
+        learner.flush()
+
+        reloaded = FileOperationLearner(data_file=data_file)
+        assert len(reloaded.get_patterns()) == 1
+        assert reloaded.get_patterns()[0]["count"] == 3
+
+
+def test_learning_system_retries_failed_flush():
+    """Verify a failed write stays pending and close() writes it"""
+    import src.watch_daemon as watch_daemon
+    from src.watch_daemon import FileOperationLearner
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_file = os.path.join(tmpdir, "test_learning.json")
+        learner = FileOperationLearner(data_file=data_file)
+        learner.record_operation(
+            src=os.path.join(tmpdir, "downloads", "report.pdf"),
+            dst=os.path.join(tmpdir, "work", "report.pdf"),
+            operation="move",
+        )
+
+        with patch.object(watch_daemon, "_write_atomic", side_effect=OSError("full")):
+            learner.flush()
+        assert learner._dirty.is_set()
+
+        learner.close()
+        assert learner._flusher is None
+        assert len(FileOperationLearner(data_file=data_file).get_patterns()) == 1
+
+
+def test_learning_system_bounds_feedback():
+    """Verify feedback history is capped and survives a reload"""
+    from src.watch_daemon import FileOperationLearner
+
+    with tempfile.TemporaryDirectory() as tmpdir, patch.object(
+        FileOperationLearner, "MAX_FEEDBACK", 5
+    ):
+        data_file = os.path.join(tmpdir, "test_learning.json")
+        learner = FileOperationLearner(data_file=data_file)
+
+        for i in range(8):
+            learner.record_feedback("downloads", f"s{i}", f"work/a{i}", True)
+        learner.flush()
+
+        assert len(learner.feedback_history) == 5
+        assert learner.get_recent_feedback()[-1]["suggested"] == "s7"
+
+        reloaded = FileOperationLearner(data_file=data_file)
+        assert [f["suggested"] for f in reloaded.get_recent_feedback()] == [
+            "s3",
+            "s4",
+            "s5",
+            "s6",
+            "s7",
+        ]
+
+
+def test_learning_worker_stops_with_daemon(monkeypatch, capsys):
+    """Verify the learner worker exits on stop() and logs learn failures"""
+    import threading
+    from src.watch_daemon import (
+        FileEvent,
+        FileOperation,
+        FileOperationLearner,
+        create_watch_daemon_with_learning,
+    )
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        monkeypatch.chdir(tmpdir)
+        monkeypatch.setattr(
+            FileOperationLearner,
+            "suggest_destination",
+            Mock(side_effect=RuntimeError("boom")),
+        )
+        before = threading.active_count()
+
+        daemon, learner, _ = create_watch_daemon_with_learning(tmpdir)
+        daemon.event_handler(
+            FileEvent(FileOperation.CREATE, os.path.join(tmpdir, "new.txt"))
+        )
+        daemon.stop()
+
+        assert threading.active_count() == before
+        assert "Error learning from" in capsys.readouterr().out
+
+
+def test_stop_waits_for_inflight_dispatch():
+    """Verify stop hooks run only after the current event is handled"""
+    import threading
+    from src.watch_daemon import WatchDaemon, FileOperation
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        entered = threading.Event()
+        handled = threading.Event()
+
+        def event_handler(event):
+            entered.set()
+            time.sleep(0.2)
+            handled.set()
+
+        daemon = WatchDaemon(watch_path=tmpdir, event_handler=event_handler)
+        seen_by_hook = []
+        daemon.add_stop_hook(lambda: seen_by_hook.append(handled.is_set()))
+
+        with patch.object(daemon, "_start_observer"):
+            daemon.start(blocking=False)
+            daemon._on_event(FileOperation.CREATE, os.path.join(tmpdir, "a.txt"))
+            assert entered.wait(timeout=5)
+
+            start = time.monotonic()
+            daemon.stop()
+
+        assert seen_by_hook == [True]
+        assert not daemon._processing_thread.is_alive()
+        assert time.monotonic() - start < 1
 
 
 if __name__ == "__main__":